@@ -4,30 +4,26 @@ A comprehensive trading application that analyzes NIFTY signals using Heikin-Ash
 Money Flow Index (MFI), and MACD crossovers.
 """
 
+import io
+
 import streamlit as st
 import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
-import plotly.graph_objects as go
 
 # Import our custom modules
 from data_fetcher import (
-    fetch_nifty_data, 
-    get_available_periods, 
+    fetch_nifty_data,
+    get_available_periods,
     get_available_intervals,
     validate_period_interval_combination,
     preprocess_data,
-    get_latest_price_info
+    get_latest_price_info,
+    _hash_ohlc_frame
 )
 from trading_indicators import calculate_all_indicators
-from visualizations import (
-    create_heikinashi_chart,
-    create_signals_summary_chart,
-    create_strength_analysis_chart,
-    create_performance_metrics_table,
-    display_latest_signals_table,
-    create_indicator_correlation_chart
-)
+
+# plotly (via the visualizations module) is imported lazily inside
+# display_dashboard so the initial page render does not pay its import cost
 
 # Page configuration
 st.set_page_config(
@@ -68,6 +64,38 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Signal-card HTML, precompiled once per import; rendering picks a template
+# and fills in the two placeholders instead of rebuilding the markup per rerun
+_SIGNAL_CARD_TEMPLATES = {
+    'BUY': """
+    <div class="signal-buy">
+        <h3>🟢 BUY SIGNAL</h3>
+        <p><strong>Strength:</strong> {strength}/3</p>
+        <p><strong>Reason:</strong> {reason}</p>
+    </div>
+    """,
+    'SELL': """
+    <div class="signal-sell">
+        <h3>🔴 SELL SIGNAL</h3>
+        <p><strong>Strength:</strong> {strength}/3</p>
+        <p><strong>Reason:</strong> {reason}</p>
+    </div>
+    """,
+    'HOLD': """
+    <div class="signal-hold">
+        <h3>⚫ HOLD</h3>
+        <p>No trading signal detected</p>
+    </div>
+    """
+}
+
+
+@st.cache_data(ttl=300, hash_funcs={pd.DataFrame: _hash_ohlc_frame})
+def _compute_indicators(df: pd.DataFrame, doji_threshold: float, mfi_oversold: int, mfi_overbought: int) -> pd.DataFrame:
+    """Cached wrapper so reruns only recompute indicators when the data or parameters change."""
+    return calculate_all_indicators(df, doji_threshold, mfi_oversold, mfi_overbought)
+
+
 def main():
     # Title and description
     st.title("📈 NIFTY Trading Signal Analyzer")
@@ -136,82 +164,99 @@ def main():
     
     # Fetch data button
     fetch_data = st.sidebar.button("🔄 Fetch Latest Data", type="primary")
-    
+
     # Auto-refresh option
     auto_refresh = st.sidebar.checkbox("🔄 Auto-refresh (5 min)", value=False)
-    
+
+    # With auto-refresh enabled, only the analysis fragment reruns every
+    # 5 minutes (matching the fetch cache TTL) instead of the whole script
     if auto_refresh:
-        st.rerun()
-    
-    # Initialize session state
-    if 'data' not in st.session_state:
-        st.session_state.data = None
-    if 'processed_data' not in st.session_state:
-        st.session_state.processed_data = None
-    
-    # Fetch data
-    if fetch_data or st.session_state.data is None:
-        with st.spinner("Fetching NIFTY data..."):
-            raw_data = fetch_nifty_data(period=period_code, interval=interval_code)
-            
-            if raw_data is not None:
-                st.session_state.data = raw_data
-                st.sidebar.success(f"✅ Fetched {len(raw_data)} data points")
-            else:
-                st.sidebar.error("❌ Failed to fetch data")
-                return
-    
-    # Process data
-    if st.session_state.data is not None:
-        with st.spinner("Processing indicators..."):
-            # Preprocess data
-            preprocessed_data = preprocess_data(st.session_state.data)
-            
-            # Calculate all indicators
-            processed_data = calculate_all_indicators(preprocessed_data)
-            st.session_state.processed_data = processed_data
-    
-    # Display results
-    if st.session_state.processed_data is not None:
-        df = st.session_state.processed_data
-        
-        # Get latest price info
-        price_info = get_latest_price_info(st.session_state.data)
-        
-        # Main dashboard
-        display_dashboard(df, price_info)
-        
+        render_analysis = st.fragment(run_every=timedelta(minutes=5))(_render_analysis)
     else:
-        st.info("👆 Please fetch data using the button in the sidebar to begin analysis.")
+        render_analysis = _render_analysis
+
+    render_analysis(fetch_data, period_code, interval_code, doji_threshold, mfi_oversold, mfi_overbought)
+
+
+def _render_analysis(fetch_data, period_code, interval_code, doji_threshold, mfi_oversold, mfi_overbought):
+    """Fetch, process, and display the analysis. Run as a fragment when auto-refresh is on."""
+
+    # The fetch cache is shared across sessions, so a cold tab reuses data
+    # another session already fetched instead of hitting Yahoo again; the
+    # button forces a refetch by clearing the cached entry first
+    if fetch_data:
+        fetch_nifty_data.clear()
+
+    with st.spinner("Fetching NIFTY data..."):
+        raw_data = fetch_nifty_data(period=period_code, interval=interval_code)
+
+    if raw_data is None:
+        st.sidebar.error("❌ Failed to fetch data")
+        return
 
+    if fetch_data:
+        st.sidebar.success(f"✅ Fetched {len(raw_data)} data points")
 
-def display_dashboard(df: pd.DataFrame, price_info: dict):
+    # Process data
+    with st.spinner("Processing indicators..."):
+        # Preprocess data
+        preprocessed_data = preprocess_data(raw_data)
+
+        # Calculate all indicators
+        df = _compute_indicators(preprocessed_data, doji_threshold, mfi_oversold, mfi_overbought)
+
+    # Get latest price info
+    price_info = get_latest_price_info(raw_data)
+
+    # Main dashboard
+    display_dashboard(df, price_info)
+
+
+def display_dashboard(df: pd.DataFrame, price_info):
     """Display the main dashboard with all charts and metrics."""
-    
+
+    # Deferred so plotly is only imported once data is ready to chart
+    from visualizations import (
+        create_heikinashi_chart,
+        create_signals_summary_chart,
+        create_strength_analysis_chart,
+        create_performance_metrics_table,
+        display_latest_signals_table,
+        create_indicator_correlation_chart
+    )
+
+    # Boolean masks shared by the metric and insight tabs; computed once
+    # per rerun instead of per metric
+    signal_arr = df['Signal'].to_numpy()
+    doji_mask = df['Is_Doji'].to_numpy()
+    buy_mask = signal_arr == 'BUY'
+    sell_mask = signal_arr == 'SELL'
+    active_mask = buy_mask | sell_mask
+
     # Latest price information
-    if price_info:
+    if price_info is not None:
         st.subheader("💰 Latest Market Information")
-        
+
         col1, col2, col3, col4, col5 = st.columns(5)
-        
+
         with col1:
             st.metric(
-                "Current Price", 
-                f"₹{price_info['close']:.2f}",
-                delta=f"{price_info['change']:+.2f} ({price_info['change_percent']:+.2f}%)"
+                "Current Price",
+                f"₹{price_info.close:.2f}",
+                delta=f"{price_info.change:+.2f} ({price_info.change_percent:+.2f}%)"
             )
-        
+
         with col2:
-            st.metric("Open", f"₹{price_info['open']:.2f}")
-        
+            st.metric("Open", f"₹{price_info.open:.2f}")
+
         with col3:
-            st.metric("High", f"₹{price_info['high']:.2f}")
-        
+            st.metric("High", f"₹{price_info.high:.2f}")
+
         with col4:
-            st.metric("Low", f"₹{price_info['low']:.2f}")
-        
+            st.metric("Low", f"₹{price_info.low:.2f}")
+
         with col5:
-            st.metric("Volume", f"{price_info['volume']:,.0f}")
+            st.metric("Volume", f"{price_info.volume:,.0f}")
         
         st.markdown("---")
     
@@ -219,34 +264,15 @@ def display_dashboard(df: pd.DataFrame, price_info: dict):
     st.subheader("🚨 Current Signal Status")
     
     if not df.empty:
-        latest_signal = df.iloc[-1]
-        signal_type = latest_signal['Signal']
-        signal_strength = latest_signal['Signal_Strength']
-        signal_reason = latest_signal['Signal_Reason']
-        
-        if signal_type == 'BUY':
-            st.markdown(f"""
-            <div class="signal-buy">
-                <h3>🟢 BUY SIGNAL</h3>
-                <p><strong>Strength:</strong> {signal_strength}/3</p>
-                <p><strong>Reason:</strong> {signal_reason}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        elif signal_type == 'SELL':
-            st.markdown(f"""
-            <div class="signal-sell">
-                <h3>🔴 SELL SIGNAL</h3>
-                <p><strong>Strength:</strong> {abs(signal_strength)}/3</p>
-                <p><strong>Reason:</strong> {signal_reason}</p>
-            </div>
-            """, unsafe_allow_html=True)
-        else:
-            st.markdown(f"""
-            <div class="signal-hold">
-                <h3>⚫ HOLD</h3>
-                <p>No trading signal detected</p>
-            </div>
-            """, unsafe_allow_html=True)
+        signal_type = df['Signal'].iloc[-1]
+        signal_strength = df['Signal_Strength'].iloc[-1]
+        signal_reason = df['Signal_Reason'].iloc[-1]
+
+        card = _SIGNAL_CARD_TEMPLATES.get(signal_type, _SIGNAL_CARD_TEMPLATES['HOLD'])
+        st.markdown(
+            card.format(strength=abs(signal_strength), reason=signal_reason),
+            unsafe_allow_html=True
+        )
     
     st.markdown("---")
     
@@ -281,13 +307,13 @@ def display_dashboard(df: pd.DataFrame, price_info: dict):
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            doji_count = len(df[df['Is_Doji']])
+            doji_count = int(doji_mask.sum())
             total_candles = len(df)
             doji_percentage = (doji_count / total_candles) * 100
             st.metric("Doji Percentage", f"{doji_percentage:.1f}%")
-        
+
         with col2:
-            signal_count = len(df[df['Signal'] != 'HOLD'])
+            signal_count = int(active_mask.sum())
             signal_percentage = (signal_count / total_candles) * 100
             st.metric("Signal Activity", f"{signal_percentage:.1f}%")
         
@@ -305,9 +331,9 @@ def display_dashboard(df: pd.DataFrame, price_info: dict):
         st.subheader("Key Insights")
         
         # Calculate some insights
-        total_signals = len(df[df['Signal'] != 'HOLD'])
-        buy_signals = len(df[df['Signal'] == 'BUY'])
-        sell_signals = len(df[df['Signal'] == 'SELL'])
+        total_signals = int(active_mask.sum())
+        buy_signals = int(buy_mask.sum())
+        sell_signals = int(sell_mask.sum())
         
         if total_signals > 0:
             buy_percentage = (buy_signals / total_signals) * 100
@@ -316,8 +342,8 @@ def display_dashboard(df: pd.DataFrame, price_info: dict):
             st.write(f"• **Signal Bias:** {buy_percentage:.1f}% BUY vs {sell_percentage:.1f}% SELL signals")
         
         # Doji with signals
-        doji_with_signals = len(df[df['Is_Doji'] & (df['Signal'] != 'HOLD')])
-        total_doji = len(df[df['Is_Doji']])
+        doji_with_signals = int((doji_mask & active_mask).sum())
+        total_doji = int(doji_mask.sum())
         
         if total_doji > 0:
             doji_signal_rate = (doji_with_signals / total_doji) * 100
@@ -334,10 +360,13 @@ def display_dashboard(df: pd.DataFrame, price_info: dict):
         
         # Export functionality
         if not signals_table.empty:
-            csv = signals_table.to_csv(index=False)
+            # Stream rows into a bytes buffer in chunks; avoids building one
+            # large intermediate str plus a second encoded copy
+            csv_buffer = io.BytesIO()
+            signals_table.to_csv(csv_buffer, index=False, chunksize=1000)
             st.download_button(
                 label="📥 Download Signal History (CSV)",
-                data=csv,
+                data=csv_buffer.getvalue(),
                 file_name=f"nifty_signals_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                 mime="text/csv"
             )
@@ -7,7 +7,32 @@ import yfinance as yf
 import pandas as pd
 import streamlit as st
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import NamedTuple, Optional
+
+
+def _hash_ohlc_frame(df: pd.DataFrame) -> tuple:
+    """
+    Cheap O(1) cache key for an OHLC DataFrame.
+
+    Streamlit's default hashing pickles the whole frame on every cache lookup;
+    the fetched data only changes when its length or last timestamp changes,
+    so (shape, last Datetime) is a sufficient and much faster key.
+    """
+    if df.empty:
+        return (df.shape, None)
+    return (df.shape, df['Datetime'].iloc[-1])
+
+
+@st.cache_resource
+def _get_nifty_ticker() -> yf.Ticker:
+    """
+    Process-wide NIFTY ticker object.
+
+    Recreating yf.Ticker on every fetch discards its underlying HTTP session;
+    caching the object as a resource keeps one session alive so repeated
+    fetches benefit from connection keep-alive.
+    """
+    return yf.Ticker("^NSEI")
 
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
@@ -24,7 +49,7 @@ def fetch_nifty_data(period: str = "1mo", interval: str = "15m") -> Optional[pd.
     """
     try:
         # Fetch NIFTY 50 data (^NSEI is the Yahoo Finance symbol for NIFTY 50)
-        ticker = yf.Ticker("^NSEI")
+        ticker = _get_nifty_ticker()
         data = ticker.history(period=period, interval=interval)
         
         if data.empty:
@@ -33,10 +58,19 @@ def fetch_nifty_data(period: str = "1mo", interval: str = "15m") -> Optional[pd.
         
         # Reset index to make datetime a column
         data.reset_index(inplace=True)
-        
-        # Rename columns to match our indicator functions
-        data.columns = ['Datetime', 'Open', 'High', 'Low', 'Close', 'Volume']
-        
+
+        # Normalize the datetime column name (daily data comes back as 'Date');
+        # rename leaves the column blocks and dtypes untouched, unlike a
+        # wholesale positional columns assignment
+        if 'Datetime' not in data.columns:
+            data.rename(columns={'Date': 'Datetime', 'index': 'Datetime'}, inplace=True)
+
+        # Keep only the columns the indicator pipeline uses (yfinance may
+        # also return Dividends / Stock Splits)
+        keep_cols = ['Datetime', 'Open', 'High', 'Low', 'Close', 'Volume']
+        if list(data.columns) != keep_cols:
+            data = data[[col for col in keep_cols if col in data.columns]]
+
         # Remove any rows with missing data
         data.dropna(inplace=True)
         
@@ -44,7 +78,10 @@ def fetch_nifty_data(period: str = "1mo", interval: str = "15m") -> Optional[pd.
         if 'Volume' not in data.columns or data['Volume'].isna().all():
             # If no volume data, create dummy volume data
             data['Volume'] = 1000000  # Set a default volume
-        
+
+        # NaNs were dropped above; let preprocess_data skip its NaN scan
+        data.attrs['nan_free'] = True
+
         return data
         
     except Exception as e:
@@ -88,34 +125,39 @@ def get_available_intervals() -> dict:
     }
 
 
+# Yahoo Finance has restrictions on period-interval combinations; built once
+# at import so validation is two hash lookups per call
+_INTERVAL_RESTRICTIONS = {
+    "1m": frozenset({"1d", "5d"}),
+    "2m": frozenset({"1d", "5d"}),
+    "5m": frozenset({"1d", "5d"}),
+    "15m": frozenset({"1d", "5d", "1mo"}),
+    "30m": frozenset({"1d", "5d", "1mo"}),
+    "1h": frozenset({"1d", "5d", "1mo", "3mo", "6mo", "1y", "2y"}),
+    "1d": frozenset({"1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"})
+}
+
+
 def validate_period_interval_combination(period: str, interval: str) -> bool:
     """
     Validate if the period and interval combination is supported by Yahoo Finance.
-    
+
     Args:
         period: Period string
         interval: Interval string
-        
+
     Returns:
         Boolean indicating if combination is valid
     """
-    # Yahoo Finance has restrictions on period-interval combinations
-    interval_restrictions = {
-        "1m": ["1d", "5d"],
-        "2m": ["1d", "5d"], 
-        "5m": ["1d", "5d"],
-        "15m": ["1d", "5d", "1mo"],
-        "30m": ["1d", "5d", "1mo"],
-        "1h": ["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y"],
-        "1d": ["1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"]
-    }
-    
-    if interval in interval_restrictions:
-        return period in interval_restrictions[interval]
-    
+    allowed_periods = _INTERVAL_RESTRICTIONS.get(interval)
+
+    if allowed_periods is not None:
+        return period in allowed_periods
+
     return True  # Default to True for unlisted combinations
 
 
+@st.cache_data(ttl=300, hash_funcs={pd.DataFrame: _hash_ohlc_frame})
 def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     Preprocess the fetched data for analysis.
@@ -126,59 +168,76 @@ def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Preprocessed DataFrame
     """
-    # Make a copy to avoid modifying original data
-    processed_df = df.copy()
-    
-    # Sort by datetime to ensure proper chronological order
-    processed_df = processed_df.sort_values('Datetime')
-    
-    # Reset index
-    processed_df.reset_index(drop=True, inplace=True)
-    
-    # Ensure all price columns are numeric
-    price_columns = ['Open', 'High', 'Low', 'Close']
-    for col in price_columns:
-        processed_df[col] = pd.to_numeric(processed_df[col], errors='coerce')
-    
-    # Ensure volume is numeric
-    processed_df['Volume'] = pd.to_numeric(processed_df['Volume'], errors='coerce')
-    
-    # Fill any remaining NaN values with forward fill
-    processed_df.fillna(method='ffill', inplace=True)
-    
-    # Drop any rows that still have NaN values
-    processed_df.dropna(inplace=True)
-    
+    processed_df = df
+
+    # yfinance returns chronologically ordered data, so only pay for a sort
+    # when the frame is actually out of order
+    if not processed_df['Datetime'].is_monotonic_increasing:
+        processed_df = processed_df.sort_values('Datetime', kind='stable', ignore_index=True)
+
+    # Coerce all numeric columns in one block pass instead of column by column
+    numeric_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
+    if not all(pd.api.types.is_numeric_dtype(processed_df[col]) for col in numeric_cols):
+        if processed_df is df:
+            processed_df = processed_df.copy()
+        processed_df[numeric_cols] = processed_df[numeric_cols].apply(pd.to_numeric, errors='coerce')
+
+    # Forward-fill and drop only when NaN values are actually present;
+    # frames coming out of fetch_nifty_data are already NaN-free and carry
+    # the nan_free marker, so they skip the scan entirely
+    if not processed_df.attrs.get('nan_free') and processed_df[numeric_cols].isna().to_numpy().any():
+        processed_df = processed_df.ffill().dropna().reset_index(drop=True)
+
     return processed_df
 
 
-def get_latest_price_info(df: pd.DataFrame) -> dict:
+class LatestPriceInfo(NamedTuple):
+    """Latest price snapshot for display in the dashboard header."""
+    datetime: object
+    close: float
+    open: float
+    high: float
+    low: float
+    volume: float
+    change: float
+    change_percent: float
+    previous_close: float
+
+
+@st.cache_data(ttl=300, hash_funcs={pd.DataFrame: _hash_ohlc_frame})
+def get_latest_price_info(df: pd.DataFrame) -> Optional[LatestPriceInfo]:
     """
     Get latest price information from the dataframe.
-    
+
     Args:
         df: DataFrame with OHLC data
-        
+
     Returns:
-        Dictionary with latest price information
+        LatestPriceInfo tuple, or None if the frame is empty
     """
     if df.empty:
-        return {}
-    
-    latest = df.iloc[-1]
-    previous = df.iloc[-2] if len(df) > 1 else latest
-    
-    change = latest['Close'] - previous['Close']
-    change_percent = (change / previous['Close']) * 100
-    
-    return {
-        'datetime': latest['Datetime'],
-        'close': latest['Close'],
-        'open': latest['Open'],
-        'high': latest['High'],
-        'low': latest['Low'],
-        'volume': latest['Volume'],
-        'change': change,
-        'change_percent': change_percent,
-        'previous_close': previous['Close']
-    }
\ No newline at end of file
+        return None
+
+    # Scalar lookups per column avoid materializing full row Series, which
+    # would copy every column (mixed dtypes force an object array) per call
+    last = len(df) - 1
+    prev = last - 1 if last > 0 else last
+
+    close_col = df['Close']
+    close = close_col.iloc[last]
+    previous_close = close_col.iloc[prev]
+
+    change = close - previous_close
+    change_percent = (change / previous_close) * 100
+
+    return LatestPriceInfo(
+        datetime=df['Datetime'].iloc[last],
+        close=close,
+        open=df['Open'].iloc[last],
+        high=df['High'].iloc[last],
+        low=df['Low'].iloc[last],
+        volume=df['Volume'].iloc[last],
+        change=change,
+        change_percent=change_percent,
+        previous_close=previous_close
+    )
\ No newline at end of file
@@ -0,0 +1,23 @@
+"""
+Shared Modal image definition for the deployment scripts.
+
+serve_streamlit.py and serve_nifty50_app.py used to declare near-identical
+debian_slim images that Modal built and cached separately. A single
+definition means both apps resolve to the same image layers, so the second
+app's cold start pulls from a hot cache instead of rebuilding.
+"""
+
+import modal
+
+# pyarrow is pinned explicitly because nifty50_app.py imports it directly
+# for the CSV downloads, not just transitively through streamlit
+BASE_IMAGE = modal.Image.debian_slim(python_version="3.11").pip_install(
+    "streamlit~=1.48.0",
+    "yfinance~=0.2.65",
+    "pandas~=2.3.1",
+    "numpy~=2.3.2",
+    "plotly~=6.3.0",
+    "ta-lib~=0.6.5",
+    "scikit-learn~=1.7.1",
+    "pyarrow>=14.0",
+)
@@ -9,6 +9,7 @@ from typing import Dict, List, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import streamlit as st
 
+from data_fetcher import _hash_ohlc_frame
 from trading_indicators import calculate_all_indicators
 
 def analyze_single_stock(
@@ -32,22 +33,28 @@ def analyze_single_stock(
         Dictionary with analysis results
     """
     try:
-        # Calculate all indicators and signals
-        df = calculate_all_indicators(data.copy(), doji_threshold, mfi_oversold, mfi_overbought)
+        # Calculate all indicators and signals; calculate_all_indicators
+        # never mutates its input (the Heikin-Ashi step only adds columns
+        # to its own frame), so no defensive copy is needed here
+        df = calculate_all_indicators(data, doji_threshold, mfi_oversold, mfi_overbought)
         
         # Get latest signal
         if not df.empty:
             latest = df.iloc[-1]
-            
-            # Calculate signal statistics
-            total_signals = len(df[df['Signal'] != 'HOLD'])
-            buy_signals = len(df[df['Signal'] == 'BUY'])
-            sell_signals = len(df[df['Signal'] == 'SELL'])
-            doji_count = len(df[df['Is_Doji']])
-            
+
+            # Calculate signal statistics in one pass over the category
+            # codes instead of six separate boolean-mask scans
+            signal_codes = df['Signal'].cat.codes.to_numpy()
+            counts = np.bincount(signal_codes[signal_codes >= 0], minlength=3)
+            buy_signals = int(counts[df['Signal'].cat.categories.get_loc('BUY')])
+            sell_signals = int(counts[df['Signal'].cat.categories.get_loc('SELL')])
+            total_signals = buy_signals + sell_signals
+            doji_count = int(df['Is_Doji'].sum())
+
             # Signal strength distribution
-            signal_strengths = df[df['Signal'] != 'HOLD']['Signal_Strength'].abs()
-            avg_signal_strength = signal_strengths.mean() if len(signal_strengths) > 0 else 0
+            strengths = df['Signal_Strength'].to_numpy()
+            active_strengths = np.abs(strengths[strengths != 0])
+            avg_signal_strength = active_strengths.mean() if active_strengths.size > 0 else 0
             
             return {
                 'stock': stock_symbol,
@@ -86,6 +93,18 @@ def analyze_single_stock(
             'statistics': {}
         }
 
+# Per-stock analysis memo keyed by data fingerprint and parameters, so a
+# refresh cycle only recomputes the stocks whose history actually changed
+_ANALYSIS_MEMO: Dict[tuple, Dict] = {}
+_ANALYSIS_MEMO_MAX = 256
+
+
+def _analysis_memo_key(stock_symbol: str, data: pd.DataFrame, doji_threshold: float,
+                       mfi_oversold: int, mfi_overbought: int) -> tuple:
+    return (stock_symbol, _hash_ohlc_frame(data), doji_threshold, mfi_oversold, mfi_overbought)
+
+
+@st.cache_data(ttl=300, hash_funcs={pd.DataFrame: _hash_ohlc_frame})
 def analyze_multiple_stocks(
     stock_data_dict: Dict[str, pd.DataFrame],
     doji_threshold: float = 0.1,
@@ -107,42 +126,62 @@ def analyze_multiple_stocks(
         Dictionary with analysis results for each stock
     """
     results = {}
-    
+
+    # Serve stocks whose data and parameters are unchanged from the memo;
+    # only the remainder goes through the indicator pipeline
+    pending = {}
+    for stock_symbol, data in stock_data_dict.items():
+        key = _analysis_memo_key(stock_symbol, data, doji_threshold, mfi_oversold, mfi_overbought)
+        cached = _ANALYSIS_MEMO.get(key)
+        if cached is not None:
+            results[stock_symbol] = cached
+        else:
+            pending[stock_symbol] = (data, key)
+
+    if not pending:
+        return results
+
     # Create progress tracking
     progress_bar = st.progress(0)
     status_text = st.empty()
-    
+
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit analysis tasks
         future_to_stock = {
             executor.submit(
-                analyze_single_stock, 
-                stock_symbol, 
-                data, 
-                doji_threshold, 
-                mfi_oversold, 
+                analyze_single_stock,
+                stock_symbol,
+                data,
+                doji_threshold,
+                mfi_oversold,
                 mfi_overbought
             ): stock_symbol
-            for stock_symbol, data in stock_data_dict.items()
+            for stock_symbol, (data, key) in pending.items()
         }
         
         completed = 0
-        total = len(stock_data_dict)
-        
+        total = len(pending)
+
         # Process completed analyses
         for future in as_completed(future_to_stock):
             stock_symbol = future_to_stock[future]
-            
+
             try:
                 result = future.result()
                 results[stock_symbol] = result
-                
+
                 if 'error' in result:
                     status_text.text(f"❌ Error analyzing {stock_symbol}: {result['error']}")
                 else:
+                    # Only clean results are memoized; errors are retried
+                    # on the next cycle
+                    if len(_ANALYSIS_MEMO) >= _ANALYSIS_MEMO_MAX:
+                        _ANALYSIS_MEMO.pop(next(iter(_ANALYSIS_MEMO)))
+                    _ANALYSIS_MEMO[pending[stock_symbol][1]] = result
+
                     signal = result['latest_signal']['signal']
                     status_text.text(f"✅ {stock_symbol}: {signal}")
-                    
+
             except Exception as e:
                 results[stock_symbol] = {
                     'stock': stock_symbol,
@@ -172,35 +211,48 @@ def create_signals_summary(analysis_results: Dict[str, Dict]) -> pd.DataFrame:
     Returns:
         DataFrame with signal summary
     """
-    summary_data = []
-    
+    summary_columns = [
+        'Stock', 'Signal', 'Strength', 'Price', 'MACD', 'MFI', 'Is_Doji',
+        'Total_Signals', 'Signal_Rate%', 'Buy_Rate%', 'Sell_Rate%',
+        'Doji_Rate%', 'Avg_Strength', 'Reason', 'Last_Update'
+    ]
+
+    # Collect plain record tuples and build the frame in one shot; tuples
+    # skip the per-row dict allocation and key hashing of the old version
+    summary_rows = []
+
     for stock_symbol, result in analysis_results.items():
         if 'error' not in result and result['latest_signal'] is not None:
             latest = result['latest_signal']
             stats = result['statistics']
-            
-            summary_data.append({
-                'Stock': stock_symbol,
-                'Signal': latest['signal'],
-                'Strength': abs(latest['strength']),
-                'Price': latest['close_price'],
-                'MACD': latest['macd'],
-                'MFI': latest['mfi'],
-                'Is_Doji': latest['is_doji'],
-                'Total_Signals': stats['total_signals'],
-                'Signal_Rate%': round(stats['signal_rate'], 1),
-                'Buy_Rate%': round(stats['buy_rate'], 1),
-                'Sell_Rate%': round(stats['sell_rate'], 1),
-                'Doji_Rate%': round(stats['doji_rate'], 1),
-                'Avg_Strength': round(stats['avg_signal_strength'], 2),
-                'Reason': latest['reason'][:50] + '...' if len(latest['reason']) > 50 else latest['reason'],
-                'Last_Update': latest['datetime']
-            })
-    
-    if summary_data:
-        df = pd.DataFrame(summary_data)
+            reason = latest['reason']
+
+            summary_rows.append((
+                stock_symbol,
+                latest['signal'],
+                abs(latest['strength']),
+                latest['close_price'],
+                latest['macd'],
+                latest['mfi'],
+                latest['is_doji'],
+                stats['total_signals'],
+                round(stats['signal_rate'], 1),
+                round(stats['buy_rate'], 1),
+                round(stats['sell_rate'], 1),
+                round(stats['doji_rate'], 1),
+                round(stats['avg_signal_strength'], 2),
+                reason[:50] + '...' if len(reason) > 50 else reason,
+                latest['datetime']
+            ))
+
+    if summary_rows:
+        df = pd.DataFrame.from_records(summary_rows, columns=summary_columns)
+        # Integer-coded Signal makes the app's equality filters a C-level
+        # code compare; Strength fits comfortably in int8
+        df['Signal'] = df['Signal'].astype(pd.CategoricalDtype(['BUY', 'HOLD', 'SELL']))
+        df['Strength'] = df['Strength'].astype(np.int8)
         return df.sort_values(['Signal', 'Strength'], ascending=[True, False])
-    
+
     return pd.DataFrame()
 
 def filter_stocks_by_signal(analysis_results: Dict[str, Dict], signal_type: str = 'BUY') -> List[Dict]:
@@ -228,9 +280,13 @@ def filter_stocks_by_signal(analysis_results: Dict[str, Dict], signal_type: str
                 'full_data': result['data']
             })
     
-    # Sort by signal strength
-    filtered_stocks.sort(key=lambda x: abs(x['signal_data']['strength']), reverse=True)
-    
+    # Sort by signal strength: one argsort over the strength array instead
+    # of a Python-level key call per comparison
+    if filtered_stocks:
+        strengths = np.abs(np.array([stock['signal_data']['strength'] for stock in filtered_stocks]))
+        order = np.argsort(-strengths, kind='stable')
+        filtered_stocks = [filtered_stocks[i] for i in order]
+
     return filtered_stocks
 
 def get_sector_performance(analysis_results: Dict[str, Dict]) -> Dict[str, Dict]:
@@ -244,51 +300,46 @@ def get_sector_performance(analysis_results: Dict[str, Dict]) -> Dict[str, Dict]
         Dictionary with sector performance data
     """
     from nifty50_stocks import get_sector_wise_stocks
-    
+
     sectors = get_sector_wise_stocks()
     sector_performance = {}
-    
+
+    # Flatten the latest signal per stock once; each sector pass below then
+    # works on plain arrays instead of re-walking the nested result dicts
+    latest_by_stock = {
+        stock: (result['latest_signal']['signal'], abs(result['latest_signal']['strength']))
+        for stock, result in analysis_results.items()
+        if 'error' not in result and result['latest_signal'] is not None
+    }
+
     for sector, stocks in sectors.items():
-        sector_data = {
-            'total_stocks': 0,
-            'buy_signals': 0,
-            'sell_signals': 0,
-            'hold_signals': 0,
-            'avg_strength': 0,
-            'stocks_with_signals': []
+        members = [stock for stock in stocks if stock in latest_by_stock]
+
+        if not members:
+            continue
+
+        signals = np.array([latest_by_stock[stock][0] for stock in members])
+        strengths = np.array([latest_by_stock[stock][1] for stock in members])
+
+        buy_mask = signals == 'BUY'
+        sell_mask = signals == 'SELL'
+        active_mask = buy_mask | sell_mask
+        active_strengths = strengths[active_mask]
+
+        sector_performance[sector] = {
+            'total_stocks': len(members),
+            'buy_signals': int(buy_mask.sum()),
+            'sell_signals': int(sell_mask.sum()),
+            'hold_signals': int((~active_mask).sum()),
+            'avg_strength': active_strengths.mean() if active_strengths.size > 0 else 0,
+            'stocks_with_signals': [
+                {'stock': stock, 'signal': signal, 'strength': strength}
+                for stock, signal, strength, active
+                in zip(members, signals, strengths, active_mask)
+                if active
+            ]
         }
-        
-        strengths = []
-        
-        for stock in stocks:
-            if stock in analysis_results and 'error' not in analysis_results[stock]:
-                result = analysis_results[stock]
-                if result['latest_signal'] is not None:
-                    sector_data['total_stocks'] += 1
-                    signal = result['latest_signal']['signal']
-                    strength = abs(result['latest_signal']['strength'])
-                    
-                    if signal == 'BUY':
-                        sector_data['buy_signals'] += 1
-                    elif signal == 'SELL':
-                        sector_data['sell_signals'] += 1
-                    else:
-                        sector_data['hold_signals'] += 1
-                    
-                    if signal != 'HOLD':
-                        strengths.append(strength)
-                        sector_data['stocks_with_signals'].append({
-                            'stock': stock,
-                            'signal': signal,
-                            'strength': strength
-                        })
-        
-        if strengths:
-            sector_data['avg_strength'] = np.mean(strengths)
-        
-        if sector_data['total_stocks'] > 0:
-            sector_performance[sector] = sector_data
-    
+
     return sector_performance
 
 def calculate_portfolio_signals(analysis_results: Dict[str, Dict]) -> Dict[str, int]:
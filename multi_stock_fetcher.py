@@ -5,12 +5,11 @@ Handles fetching data for multiple stocks concurrently and efficiently.
 
 import yfinance as yf
 import pandas as pd
+import numpy as np
 import streamlit as st
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
-from nifty50_stocks import get_nifty50_stocks, get_top_fno_stocks
+from nifty50_stocks import get_nifty50_stocks, get_top_fno_stocks, get_top_fno_symbols
 
 def fetch_single_stock_data(stock_symbol: str, period: str = "1mo", interval: str = "15m") -> Optional[pd.DataFrame]:
     """
@@ -44,8 +43,6 @@ def fetch_single_stock_data(stock_symbol: str, period: str = "1mo", interval: st
             # Handle other cases
             required_cols = ['Open', 'High', 'Low', 'Close']
             if all(col in data.columns for col in required_cols):
-                if 'Volume' not in data.columns:
-                    data['Volume'] = 1000000
                 # Rename Datetime column if it exists
                 if 'Date' in data.columns:
                     data['Datetime'] = data['Date']
@@ -53,99 +50,128 @@ def fetch_single_stock_data(stock_symbol: str, period: str = "1mo", interval: st
                     data['Datetime'] = data.index
             else:
                 return None
-        
+
+        # Without real volume the MFI (a volume-weighted oscillator) is
+        # meaningless, and a constant placeholder silently skews every
+        # signal derived from it, so treat missing volume as a failed fetch
+        if 'Volume' not in data.columns or data['Volume'].isna().all():
+            return None
+
         # Add stock symbol for identification
         data['Symbol'] = stock_symbol.replace('.NS', '')
-        
+
         # Remove any rows with missing data
         data.dropna(inplace=True)
-        
-        # Ensure we have volume data
-        if 'Volume' not in data.columns or data['Volume'].isna().all():
-            data['Volume'] = 1000000  # Default volume
-        
+
         return data
         
     except Exception as e:
         print(f"Error fetching data for {stock_symbol}: {str(e)}")
         return None
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@st.cache_data(ttl=300, persist="disk")  # 5 min TTL, survives app restarts
 def fetch_multiple_stocks_data(
-    stock_symbols: List[str], 
-    period: str = "1mo", 
+    stock_symbols: List[str],
+    period: str = "1mo",
     interval: str = "15m",
     max_workers: int = 10
 ) -> Dict[str, pd.DataFrame]:
     """
-    Fetch data for multiple stocks concurrently.
-    
+    Fetch data for multiple stocks with a single batched download.
+
     Args:
         stock_symbols: List of Yahoo Finance symbols
         period: Data period
         interval: Data interval
-        max_workers: Maximum number of concurrent workers
-        
+        max_workers: Maximum number of concurrent download threads
+
     Returns:
         Dictionary with stock symbols as keys and DataFrames as values
     """
     results = {}
-    
+
     # Create progress bar
     progress_bar = st.progress(0)
     status_text = st.empty()
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_symbol = {
-            executor.submit(fetch_single_stock_data, symbol, period, interval): symbol
-            for symbol in stock_symbols
-        }
-        
-        completed = 0
-        total = len(stock_symbols)
-        
-        # Process completed tasks
-        for future in as_completed(future_to_symbol):
-            symbol = future_to_symbol[future]
-            
-            try:
-                data = future.result()
-                if data is not None:
-                    stock_name = symbol.replace('.NS', '')
+    status_text.text(f"📥 Downloading {len(stock_symbols)} symbols in one batch...")
+
+    try:
+        # One batched request instead of a Ticker().history() call per
+        # symbol; yfinance multiplexes the per-symbol downloads internally
+        batch = yf.download(
+            tickers=stock_symbols,
+            period=period,
+            interval=interval,
+            group_by='ticker',
+            threads=min(max_workers, len(stock_symbols)),
+            progress=False,
+        )
+    except Exception as e:
+        progress_bar.empty()
+        status_text.empty()
+        print(f"Error fetching batch data: {str(e)}")
+        return results
+
+    total = len(stock_symbols)
+    multi_symbol = isinstance(batch.columns, pd.MultiIndex)
+
+    for completed, symbol in enumerate(stock_symbols, start=1):
+        stock_name = symbol.replace('.NS', '')
+
+        try:
+            data = batch[symbol] if multi_symbol else batch
+            data = data.dropna(how='all')
+
+            if not data.empty:
+                data = data.reset_index()
+
+                # Normalize the datetime column name (daily data uses 'Date')
+                if 'Datetime' not in data.columns:
+                    data = data.rename(columns={'Date': 'Datetime', 'index': 'Datetime'})
+
+                # Keep only the columns the indicator pipeline uses
+                data = data[['Datetime', 'Open', 'High', 'Low', 'Close', 'Volume']]
+
+                # Add stock symbol for identification
+                data['Symbol'] = stock_name
+
+                # Remove any rows with missing data
+                data = data.dropna()
+
+                if not data.empty:
                     results[stock_name] = data
                     status_text.text(f"✅ Fetched data for {stock_name}")
                 else:
-                    status_text.text(f"❌ Failed to fetch data for {symbol.replace('.NS', '')}")
-            except Exception as e:
-                status_text.text(f"❌ Error with {symbol.replace('.NS', '')}: {str(e)}")
-            
-            completed += 1
-            progress_bar.progress(completed / total)
-            time.sleep(0.1)  # Small delay to show progress
-    
+                    status_text.text(f"❌ No data for {stock_name}")
+            else:
+                status_text.text(f"❌ Failed to fetch data for {stock_name}")
+        except (KeyError, ValueError):
+            status_text.text(f"❌ Failed to fetch data for {stock_name}")
+
+        progress_bar.progress(completed / total)
+
     # Clear progress indicators
     progress_bar.empty()
     status_text.empty()
-    
+
     return results
 
-def fetch_nifty50_data(period: str = "1mo", interval: str = "15m", top_n: int = 50) -> Dict[str, pd.DataFrame]:
+def fetch_nifty50_data(period: str = "1mo", interval: str = "15m", top_n: int = 50, max_workers: int = 16) -> Dict[str, pd.DataFrame]:
     """
     Fetch data for top N Nifty 50 FNO stocks.
-    
+
     Args:
         period: Data period
         interval: Data interval
         top_n: Number of top stocks to fetch
-        
+        max_workers: Maximum number of concurrent download workers
+
     Returns:
         Dictionary with stock data
     """
-    stocks = get_top_fno_stocks(top_n)
-    stock_symbols = list(stocks.values())
-    
-    return fetch_multiple_stocks_data(stock_symbols, period, interval)
+    stock_symbols = list(get_top_fno_symbols(top_n))
+
+    return fetch_multiple_stocks_data(stock_symbols, period, interval, max_workers=max_workers)
 
 def combine_stock_data(stock_data_dict: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     """
@@ -157,19 +183,23 @@ def combine_stock_data(stock_data_dict: Dict[str, pd.DataFrame]) -> pd.DataFrame
     Returns:
         Combined DataFrame with all stocks
     """
-    all_data = []
-    
-    for stock_symbol, data in stock_data_dict.items():
-        if data is not None and not data.empty:
-            data_copy = data.copy()
-            data_copy['Stock'] = stock_symbol
-            all_data.append(data_copy)
-    
-    if all_data:
-        combined_df = pd.concat(all_data, ignore_index=True)
-        return combined_df.sort_values(['Stock', 'Datetime']).reset_index(drop=True)
-    
-    return pd.DataFrame()
+    frames = {
+        stock_symbol: data
+        for stock_symbol, data in stock_data_dict.items()
+        if data is not None and not data.empty
+    }
+
+    if not frames:
+        return pd.DataFrame()
+
+    # A single keyed concat labels each block through the index instead of
+    # deep-copying every frame just to add a Stock column
+    combined_df = pd.concat(frames.values(), keys=frames.keys(), names=['Stock', None])
+    combined_df = combined_df.reset_index(level='Stock')
+    combined_df = combined_df.sort_values(['Stock', 'Datetime'], ignore_index=True)
+
+    # Keep the Stock column in its historical last position
+    return combined_df[[col for col in combined_df.columns if col != 'Stock'] + ['Stock']]
 
 def get_stock_summary(stock_data_dict: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     """
@@ -181,33 +211,42 @@ def get_stock_summary(stock_data_dict: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     Returns:
         Summary DataFrame
     """
-    summary_data = []
-    
-    for stock_symbol, data in stock_data_dict.items():
-        if data is not None and not data.empty:
-            latest = data.iloc[-1]
-            previous = data.iloc[-2] if len(data) > 1 else latest
-            
-            change = latest['Close'] - previous['Close']
-            change_percent = (change / previous['Close']) * 100 if previous['Close'] != 0 else 0
-            
-            summary_data.append({
-                'Stock': stock_symbol,
-                'Close': latest['Close'],
-                'Open': latest['Open'],
-                'High': latest['High'],
-                'Low': latest['Low'],
-                'Volume': latest['Volume'],
-                'Change': change,
-                'Change%': change_percent,
-                'Last_Updated': latest['Datetime']
-            })
-    
-    if summary_data:
-        df = pd.DataFrame(summary_data)
-        return df.sort_values('Change%', ascending=False).reset_index(drop=True)
-    
-    return pd.DataFrame()
+    frames = {
+        stock_symbol: data
+        for stock_symbol, data in stock_data_dict.items()
+        if data is not None and not data.empty
+    }
+
+    if not frames:
+        return pd.DataFrame()
+
+    # Gather the latest/previous scalars per stock column-wise, then compute
+    # change and percent change for all stocks in one vectorized step
+    closes = np.array([data['Close'].iloc[-1] for data in frames.values()])
+    prev_closes = np.array([
+        data['Close'].iloc[-2] if len(data) > 1 else data['Close'].iloc[-1]
+        for data in frames.values()
+    ])
+
+    changes = closes - prev_closes
+    change_percents = np.divide(
+        changes * 100, prev_closes,
+        out=np.zeros_like(changes), where=prev_closes != 0
+    )
+
+    df = pd.DataFrame({
+        'Stock': list(frames.keys()),
+        'Close': closes,
+        'Open': [data['Open'].iloc[-1] for data in frames.values()],
+        'High': [data['High'].iloc[-1] for data in frames.values()],
+        'Low': [data['Low'].iloc[-1] for data in frames.values()],
+        'Volume': [data['Volume'].iloc[-1] for data in frames.values()],
+        'Change': changes,
+        'Change%': change_percents,
+        'Last_Updated': [data['Datetime'].iloc[-1] for data in frames.values()]
+    })
+
+    return df.sort_values('Change%', ascending=False, ignore_index=True)
 
 def validate_stock_data(stock_data_dict: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
     """
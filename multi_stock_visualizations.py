@@ -11,6 +11,96 @@ from plotly.subplots import make_subplots
 import streamlit as st
 from typing import Dict, List
 
+# Shared dark layout registered once at import; each update_layout call
+# used to rebuild the same background/font dicts inline
+import plotly.io as pio
+pio.templates['signal_dark'] = go.layout.Template(layout=dict(
+    plot_bgcolor='rgba(0,0,0,0)',
+    paper_bgcolor='rgba(0,0,0,0)',
+    font=dict(color='white')
+))
+
+from data_fetcher import _hash_ohlc_frame
+
+def _hash_analysis_results(analysis_results: Dict[str, Dict]) -> tuple:
+    """
+    Cheap fingerprint of an analysis-results dict for Streamlit cache keys.
+
+    Pickling the nested per-stock DataFrames on every cache lookup would cost
+    more than rebuilding the figure; the charts only change when a stock's
+    latest bar or signal changes, so (stock, datetime, signal, strength) per
+    stock is a sufficient key.
+    """
+    return tuple(
+        (stock, result['latest_signal']['datetime'],
+         result['latest_signal']['signal'], result['latest_signal']['strength'])
+        if 'error' not in result and result['latest_signal'] is not None
+        else (stock, None)
+        for stock, result in analysis_results.items()
+    )
+
+def _hash_sector_performance(sector_performance: Dict[str, Dict]) -> tuple:
+    """Fingerprint of a sector-performance dict for Streamlit cache keys."""
+    return tuple(
+        (sector, stats['buy_signals'], stats['sell_signals'],
+         stats['hold_signals'], stats['total_stocks'], stats['avg_strength'])
+        for sector, stats in sector_performance.items()
+    )
+
+# Signal color constants shared by the chart builders; the rgba entries
+# are format templates taking the strength-derived alpha
+_COLOR_MAP = {'BUY': '#22c55e', 'SELL': '#ef4444', 'HOLD': '#9ca3af'}
+_SIGNAL_RGBA = {
+    'BUY': 'rgba(34, 197, 94, {})',
+    'SELL': 'rgba(239, 68, 68, {})',
+    'HOLD': 'rgba(156, 163, 175, 0.3)'
+}
+
+# Column order of the frame produced by _materialize; fixing it up front
+# keeps the empty-results frame usable by every chart builder
+_LATEST_COLUMNS = [
+    'Stock', 'signal', 'strength', 'reason', 'close_price', 'ha_close',
+    'macd', 'macd_signal', 'mfi', 'is_doji', 'datetime'
+]
+
+def _materialize(analysis_results: Dict[str, Dict]) -> pd.DataFrame:
+    """
+    Flatten the latest signal of every analyzed stock into one DataFrame.
+
+    Each chart builder used to re-walk analysis_results and re-parse the
+    nested latest_signal dicts; walking the dict once here gives the
+    builders cheap columnar access instead.
+
+    Args:
+        analysis_results: Dictionary of analysis results
+
+    Returns:
+        DataFrame with one row per stock and the latest signal fields as columns
+    """
+    records = [
+        {'Stock': stock_symbol, **result['latest_signal']}
+        for stock_symbol, result in analysis_results.items()
+        if 'error' not in result and result['latest_signal'] is not None
+    ]
+    return pd.DataFrame.from_records(records, columns=_LATEST_COLUMNS)
+
+# Roughly the point density a Plotly chart stays responsive at; longer
+# intraday histories are thinned to this budget before rendering
+_MAX_RENDER_POINTS = 2000
+
+def _downsample_for_render(df: pd.DataFrame, max_points: int = _MAX_RENDER_POINTS) -> pd.DataFrame:
+    """
+    Thin a frame to at most max_points evenly strided rows for plotting.
+
+    Strides backwards from the end so the most recent bar is always kept,
+    then restores chronological order.
+    """
+    if len(df) <= max_points:
+        return df
+    step = -(-len(df) // max_points)
+    return df.iloc[::-1].iloc[::step].iloc[::-1]
+
+@st.cache_data(ttl=300, hash_funcs={dict: _hash_analysis_results})
 def create_portfolio_overview_chart(analysis_results: Dict[str, Dict]) -> go.Figure:
     """
     Create a portfolio overview chart showing signal distribution.
@@ -22,17 +112,16 @@ def create_portfolio_overview_chart(analysis_results: Dict[str, Dict]) -> go.Fig
         Plotly figure
     """
     # Count signals
-    signal_counts = {'BUY': 0, 'SELL': 0, 'HOLD': 0}
-    
-    for result in analysis_results.values():
-        if 'error' not in result and result['latest_signal'] is not None:
-            signal = result['latest_signal']['signal']
-            signal_counts[signal] += 1
-    
+    latest = _materialize(analysis_results)
+    if latest.empty:
+        return go.Figure()
+
+    signal_counts = latest['signal'].value_counts().reindex(['BUY', 'SELL', 'HOLD'], fill_value=0)
+
     # Create pie chart
     fig = go.Figure(data=[go.Pie(
-        labels=list(signal_counts.keys()),
-        values=list(signal_counts.values()),
+        labels=signal_counts.index.tolist(),
+        values=signal_counts.to_numpy(),
         hole=0.4,
         marker=dict(
             colors=['#22c55e', '#ef4444', '#9ca3af'],
@@ -43,14 +132,13 @@ def create_portfolio_overview_chart(analysis_results: Dict[str, Dict]) -> go.Fig
     fig.update_layout(
         title="Portfolio Signal Distribution",
         showlegend=True,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white'),
+        template='signal_dark',
         height=400
     )
     
     return fig
 
+@st.cache_data(ttl=300, hash_funcs={dict: _hash_sector_performance})
 def create_sector_analysis_chart(sector_performance: Dict[str, Dict]) -> go.Figure:
     """
     Create sector analysis chart.
@@ -61,42 +149,41 @@ def create_sector_analysis_chart(sector_performance: Dict[str, Dict]) -> go.Figu
     Returns:
         Plotly figure
     """
-    sectors = list(sector_performance.keys())
-    buy_signals = [data['buy_signals'] for data in sector_performance.values()]
-    sell_signals = [data['sell_signals'] for data in sector_performance.values()]
-    total_stocks = [data['total_stocks'] for data in sector_performance.values()]
-    
-    fig = go.Figure()
-    
-    # Add buy signals
-    fig.add_trace(go.Bar(
-        name='Buy Signals',
-        x=sectors,
-        y=buy_signals,
-        marker_color='#22c55e'
-    ))
-    
-    # Add sell signals  
-    fig.add_trace(go.Bar(
-        name='Sell Signals',
-        x=sectors,
-        y=sell_signals,
-        marker_color='#ef4444'
-    ))
+    if not sector_performance:
+        return go.Figure()
+
+    # One columnar construction instead of a Python iteration per series;
+    # .to_numpy() hands Plotly plain arrays rather than labeled Series
+    sector_df = pd.DataFrame.from_dict(sector_performance, orient='index')
+
+    # Both bars go into the constructor so the figure is validated once
+    fig = go.Figure(data=[
+        go.Bar(
+            name='Buy Signals',
+            x=sector_df.index.to_numpy(),
+            y=sector_df['buy_signals'].to_numpy(),
+            marker_color='#22c55e'
+        ),
+        go.Bar(
+            name='Sell Signals',
+            x=sector_df.index.to_numpy(),
+            y=sector_df['sell_signals'].to_numpy(),
+            marker_color='#ef4444'
+        )
+    ])
     
     fig.update_layout(
         title="Sector-wise Signal Distribution",
         xaxis_title="Sectors",
         yaxis_title="Number of Signals",
         barmode='group',
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white'),
+        template='signal_dark',
         height=500
     )
     
     return fig
 
+@st.cache_data(ttl=300, hash_funcs={dict: _hash_analysis_results})
 def create_signal_strength_heatmap(analysis_results: Dict[str, Dict]) -> go.Figure:
     """
     Create a heatmap showing signal strength across stocks.
@@ -107,40 +194,30 @@ def create_signal_strength_heatmap(analysis_results: Dict[str, Dict]) -> go.Figu
     Returns:
         Plotly figure
     """
-    # Prepare data for heatmap
-    stocks = []
-    strengths = []
-    signals = []
-    
-    for stock_symbol, result in analysis_results.items():
-        if 'error' not in result and result['latest_signal'] is not None:
-            stocks.append(stock_symbol)
-            signal = result['latest_signal']['signal']
-            strength = result['latest_signal']['strength']
-            
-            if signal == 'BUY':
-                strengths.append(strength)
-            elif signal == 'SELL':
-                strengths.append(-abs(strength))  # Negative for sell
-            else:
-                strengths.append(0)
-            
-            signals.append(signal)
-    
-    # Sort by strength
-    sorted_data = sorted(zip(stocks, strengths, signals), key=lambda x: x[1], reverse=True)
-    stocks, strengths, signals = zip(*sorted_data) if sorted_data else ([], [], [])
-    
-    # Create color scale based on signal type
-    colors = []
-    for signal, strength in zip(signals, strengths):
-        if signal == 'BUY':
-            colors.append(f'rgba(34, 197, 94, {min(abs(strength)/3, 1)})')  # Green
-        elif signal == 'SELL':
-            colors.append(f'rgba(239, 68, 68, {min(abs(strength)/3, 1)})')  # Red
-        else:
-            colors.append('rgba(156, 163, 175, 0.3)')  # Gray
-    
+    # The sign flip, sort and alpha computation all run on NumPy arrays
+    # pulled straight out of the materialized frame
+    latest = _materialize(analysis_results)
+    if latest.empty:
+        return go.Figure()
+
+    stocks = latest['Stock'].to_numpy()
+    signals = latest['signal'].to_numpy()
+    raw_strengths = latest['strength'].to_numpy()
+
+    # Negative for sell, zero for hold
+    strengths = np.where(
+        signals == 'SELL', -np.abs(raw_strengths),
+        np.where(signals == 'BUY', raw_strengths, 0)
+    )
+
+    # Sort by strength (stable, descending) and reorder all columns at once
+    order = np.argsort(-strengths, kind='stable')
+    stocks, signals, strengths = stocks[order], signals[order], strengths[order]
+
+    # Color scale based on signal type; alphas computed in one shot
+    alphas = np.minimum(np.abs(strengths) / 3, 1.0)
+    colors = [_SIGNAL_RGBA[signal].format(alpha) for signal, alpha in zip(signals, alphas)]
+
     fig = go.Figure(data=go.Bar(
         x=stocks,
         y=strengths,
@@ -153,9 +230,7 @@ def create_signal_strength_heatmap(analysis_results: Dict[str, Dict]) -> go.Figu
         title="Signal Strength Across Stocks",
         xaxis_title="Stocks",
         yaxis_title="Signal Strength",
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white'),
+        template='signal_dark',
         height=600,
         xaxis=dict(tickangle=-45)
     )
@@ -174,31 +249,30 @@ def create_top_signals_table(analysis_results: Dict[str, Dict], signal_type: str
     Returns:
         DataFrame with top signals
     """
-    signal_data = []
-    
-    for stock_symbol, result in analysis_results.items():
-        if ('error' not in result and 
-            result['latest_signal'] is not None and 
-            result['latest_signal']['signal'] == signal_type):
-            
-            latest = result['latest_signal']
-            signal_data.append({
-                'Stock': stock_symbol,
-                'Signal': latest['signal'],
-                'Strength': abs(latest['strength']),
-                'Price': f"₹{latest['close_price']:.2f}",
-                'MACD': f"{latest['macd']:.4f}",
-                'MFI': f"{latest['mfi']:.1f}",
-                'Doji': '✓' if latest['is_doji'] else '✗',
-                'Reason': latest['reason']
-            })
-    
-    if signal_data:
-        df = pd.DataFrame(signal_data)
-        return df.sort_values('Strength', ascending=False).head(top_n)
-    
-    return pd.DataFrame()
+    latest = _materialize(analysis_results)
+    picks = latest[latest['signal'] == signal_type]
+
+    if picks.empty:
+        return pd.DataFrame()
 
+    # Pick the top_n rows first (O(N + k log k) instead of a full sort).
+    # Columns stay numeric/boolean: Arrow serializes them zero-copy for
+    # st.dataframe, and display formatting lives in the caller's
+    # column_config instead of Python f-strings
+    picks = picks.assign(Strength=picks['strength'].abs()).nlargest(top_n, 'Strength')
+
+    return pd.DataFrame({
+        'Stock': picks['Stock'].to_numpy(),
+        'Signal': picks['signal'].to_numpy(),
+        'Strength': picks['Strength'].to_numpy(),
+        'Price': picks['close_price'].to_numpy(),
+        'MACD': picks['macd'].to_numpy(),
+        'MFI': picks['mfi'].to_numpy(),
+        'Doji': picks['is_doji'].to_numpy(),
+        'Reason': picks['reason'].to_numpy()
+    })
+
+@st.cache_data(ttl=300, hash_funcs={dict: _hash_analysis_results})
 def create_mfi_macd_scatter(analysis_results: Dict[str, Dict]) -> go.Figure:
     """
     Create scatter plot of MFI vs MACD with signal coloring.
@@ -209,39 +283,26 @@ def create_mfi_macd_scatter(analysis_results: Dict[str, Dict]) -> go.Figure:
     Returns:
         Plotly figure
     """
-    mfi_values = []
-    macd_values = []
-    signals = []
-    stocks = []
-    
-    for stock_symbol, result in analysis_results.items():
-        if 'error' not in result and result['latest_signal'] is not None:
-            latest = result['latest_signal']
-            mfi_values.append(latest['mfi'])
-            macd_values.append(latest['macd'])
-            signals.append(latest['signal'])
-            stocks.append(stock_symbol)
-    
+    latest = _materialize(analysis_results)
+    if latest.empty:
+        return go.Figure()
+
     # Create color mapping
-    color_map = {'BUY': '#22c55e', 'SELL': '#ef4444', 'HOLD': '#9ca3af'}
-    colors = [color_map[signal] for signal in signals]
-    
-    fig = go.Figure()
-    
-    # Add scatter plot
-    fig.add_trace(go.Scatter(
-        x=mfi_values,
-        y=macd_values,
+    colors = [_COLOR_MAP[signal] for signal in latest['signal']]
+
+    fig = go.Figure(data=[go.Scatter(
+        x=latest['mfi'].to_numpy(),
+        y=latest['macd'].to_numpy(),
         mode='markers',
         marker=dict(
             color=colors,
             size=10,
             line=dict(width=1, color='white')
         ),
-        text=stocks,
+        text=latest['Stock'].to_numpy(),
         textposition='top center',
         name='Stocks'
-    ))
+    )])
     
     # Add reference lines
     fig.add_hline(y=0, line_dash="dash", line_color="white", opacity=0.5)
@@ -252,14 +313,13 @@ def create_mfi_macd_scatter(analysis_results: Dict[str, Dict]) -> go.Figure:
         title="MFI vs MACD Signal Analysis",
         xaxis_title="MFI",
         yaxis_title="MACD",
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white'),
+        template='signal_dark',
         height=500
     )
     
     return fig
 
+@st.cache_data(ttl=300, hash_funcs={pd.DataFrame: _hash_ohlc_frame})
 def create_individual_stock_chart(stock_data: pd.DataFrame, stock_name: str) -> go.Figure:
     """
     Create detailed chart for individual stock.
@@ -274,7 +334,7 @@ def create_individual_stock_chart(stock_data: pd.DataFrame, stock_name: str) ->
     # Create subplots
     fig = make_subplots(
         rows=4, cols=1,
-        shared_xaxis=True,
+        shared_xaxes=True,
         vertical_spacing=0.05,
         subplot_titles=[
             f'{stock_name} - Heikin Ashi Candles',
@@ -284,94 +344,121 @@ def create_individual_stock_chart(stock_data: pd.DataFrame, stock_name: str) ->
         ],
         row_heights=[0.4, 0.2, 0.2, 0.2]
     )
-    
+
+    # Continuous traces are thinned to the render budget; the sparse
+    # marker traces below keep full resolution
+    view = _downsample_for_render(stock_data)
+
+    # Traces are collected into one list and attached with a single
+    # add_traces call, so Plotly validates the figure schema once instead
+    # of once per trace
+    traces = []
+    trace_rows = []
+
     # Heikin Ashi candlestick chart
-    fig.add_trace(go.Candlestick(
-        x=stock_data['Datetime'],
-        open=stock_data['HA_Open'],
-        high=stock_data['HA_High'],
-        low=stock_data['HA_Low'],
-        close=stock_data['HA_Close'],
+    traces.append(go.Candlestick(
+        x=view['Datetime'].to_numpy(),
+        open=view['HA_Open'].to_numpy(),
+        high=view['HA_High'].to_numpy(),
+        low=view['HA_Low'].to_numpy(),
+        close=view['HA_Close'].to_numpy(),
         name='Heikin Ashi',
         increasing_line_color='#22c55e',
         decreasing_line_color='#ef4444'
-    ), row=1, col=1)
-    
+    ))
+    trace_rows.append(1)
+
+
+    # Marker traces only need two columns each, so boolean-mask the
+    # underlying arrays instead of slicing out intermediate DataFrames
+    datetimes = stock_data['Datetime'].to_numpy()
+
     # Mark Doji patterns
-    doji_points = stock_data[stock_data['Is_Doji']]
-    if not doji_points.empty:
-        fig.add_trace(go.Scatter(
-            x=doji_points['Datetime'],
-            y=doji_points['HA_High'] * 1.01,
+    doji_mask = stock_data['Is_Doji'].to_numpy()
+    if doji_mask.any():
+        traces.append(go.Scatter(
+            x=datetimes[doji_mask],
+            y=stock_data['HA_High'].to_numpy()[doji_mask] * 1.01,
             mode='markers',
             marker=dict(symbol='star', size=8, color='yellow'),
             name='Doji',
             showlegend=True
-        ), row=1, col=1)
-    
+        ))
+        trace_rows.append(1)
+
     # MACD
-    if 'MACD' in stock_data.columns:
-        fig.add_trace(go.Scatter(
-            x=stock_data['Datetime'],
-            y=stock_data['MACD'],
+    if 'MACD' in view.columns:
+        traces.append(go.Scattergl(
+            x=view['Datetime'].to_numpy(),
+            y=view['MACD'].to_numpy(),
             name='MACD',
             line=dict(color='blue')
-        ), row=2, col=1)
-        
-        fig.add_trace(go.Scatter(
-            x=stock_data['Datetime'],
-            y=stock_data['MACD_Signal'],
+        ))
+        traces.append(go.Scattergl(
+            x=view['Datetime'].to_numpy(),
+            y=view['MACD_Signal'].to_numpy(),
             name='MACD Signal',
             line=dict(color='red')
-        ), row=2, col=1)
-    
+        ))
+        trace_rows.extend([2, 2])
+
     # MFI
-    if 'MFI' in stock_data.columns:
-        fig.add_trace(go.Scatter(
-            x=stock_data['Datetime'],
-            y=stock_data['MFI'],
+    if 'MFI' in view.columns:
+        traces.append(go.Scattergl(
+            x=view['Datetime'].to_numpy(),
+            y=view['MFI'].to_numpy(),
             name='MFI',
             line=dict(color='purple')
-        ), row=3, col=1)
-        
-        # Add MFI reference lines
-        fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=3, col=1)
-        fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=3, col=1)
-    
-    # Trading signals
-    buy_signals = stock_data[stock_data['Signal'] == 'BUY']
-    sell_signals = stock_data[stock_data['Signal'] == 'SELL']
-    
-    if not buy_signals.empty:
-        fig.add_trace(go.Scatter(
-            x=buy_signals['Datetime'],
-            y=[1] * len(buy_signals),
+        ))
+        trace_rows.append(3)
+
+    # Trading signals: decode the categorical column once and compare
+    # int8 codes, rather than materializing an object array of strings
+    # and scanning it twice
+    signal_col = stock_data['Signal']
+    signal_codes = signal_col.cat.codes.to_numpy()
+    buy_mask = signal_codes == signal_col.cat.categories.get_loc('BUY')
+    sell_mask = signal_codes == signal_col.cat.categories.get_loc('SELL')
+
+    if buy_mask.any():
+        traces.append(go.Scatter(
+            x=datetimes[buy_mask],
+            y=np.ones(int(buy_mask.sum())),
             mode='markers',
             marker=dict(symbol='triangle-up', size=10, color='green'),
             name='Buy Signal'
-        ), row=4, col=1)
-    
-    if not sell_signals.empty:
-        fig.add_trace(go.Scatter(
-            x=sell_signals['Datetime'],
-            y=[-1] * len(sell_signals),
+        ))
+        trace_rows.append(4)
+
+    if sell_mask.any():
+        traces.append(go.Scatter(
+            x=datetimes[sell_mask],
+            y=np.full(int(sell_mask.sum()), -1),
             mode='markers',
             marker=dict(symbol='triangle-down', size=10, color='red'),
             name='Sell Signal'
-        ), row=4, col=1)
-    
+        ))
+        trace_rows.append(4)
+
+    fig.add_traces(traces, rows=trace_rows, cols=[1] * len(traces))
+
+    # MFI reference lines
+    if 'MFI' in view.columns:
+        fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=3, col=1)
+        fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=3, col=1)
+
+
     # Update layout
     fig.update_layout(
         height=800,
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        font=dict(color='white'),
+        template='signal_dark',
         showlegend=True,
         xaxis_rangeslider_visible=False
     )
     
     return fig
 
+@st.cache_data(ttl=300, hash_funcs={dict: _hash_analysis_results})
 def create_correlation_matrix(analysis_results: Dict[str, Dict]) -> go.Figure:
     """
     Create correlation matrix between different indicators.
@@ -382,28 +469,26 @@ def create_correlation_matrix(analysis_results: Dict[str, Dict]) -> go.Figure:
     Returns:
         Plotly figure
     """
-    # Collect indicator data
-    indicator_data = []
-    
-    for stock_symbol, result in analysis_results.items():
-        if 'error' not in result and not result['data'].empty:
-            data = result['data']
-            if len(data) > 0:
-                latest = data.iloc[-1]
-                indicator_data.append({
-                    'Stock': stock_symbol,
-                    'MACD': latest.get('MACD', 0),
-                    'MFI': latest.get('MFI', 50),
-                    'Close': latest['Close'],
-                    'Volume': latest['Volume'],
-                    'Signal_Strength': abs(latest.get('Signal_Strength', 0))
-                })
-    
-    if indicator_data:
-        df = pd.DataFrame(indicator_data)
-        
+    # Collect the last row of every stock frame and concatenate once,
+    # instead of materializing a labeled Series per stock via iloc[-1]
+    numeric_cols = ['MACD', 'MFI', 'Close', 'Volume', 'Signal_Strength']
+    last_rows = [
+        result['data'].iloc[[-1]]
+        for result in analysis_results.values()
+        if 'error' not in result and not result['data'].empty
+    ]
+
+    # Correlation is undefined for fewer than two stocks
+    if len(last_rows) >= 2:
+        df = pd.concat(last_rows, ignore_index=True)
+
+        # Backfill indicators a short history may not have produced
+        for col, default in (('MACD', 0.0), ('MFI', 50.0), ('Signal_Strength', 0)):
+            if col not in df.columns:
+                df[col] = default
+        df['Signal_Strength'] = df['Signal_Strength'].abs()
+
         # Calculate correlation matrix
-        numeric_cols = ['MACD', 'MFI', 'Close', 'Volume', 'Signal_Strength']
         corr_matrix = df[numeric_cols].corr()
         
         # Create heatmap
@@ -421,9 +506,7 @@ def create_correlation_matrix(analysis_results: Dict[str, Dict]) -> go.Figure:
         
         fig.update_layout(
             title="Indicator Correlation Matrix",
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            font=dict(color='white'),
+            template='signal_dark',
             height=500
         )
         
@@ -3,11 +3,14 @@ Nifty 50 FNO Trading Signal Analyzer
 Comprehensive analysis of top 50 Nifty 50 FNO stocks using Heikin Ashi Doji, MACD, and MFI.
 """
 
+import io
+
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+from pyarrow import csv as pa_csv
 from datetime import datetime, timedelta
-import time
 
 # Import custom modules
 from nifty50_stocks import get_nifty50_stocks, get_sector_wise_stocks, get_top_fno_stocks
@@ -19,15 +22,9 @@ from multi_stock_analyzer import (
     get_sector_performance,
     calculate_portfolio_signals
 )
-from multi_stock_visualizations import (
-    create_portfolio_overview_chart,
-    create_sector_analysis_chart,
-    create_signal_strength_heatmap,
-    create_top_signals_table,
-    create_mfi_macd_scatter,
-    create_individual_stock_chart,
-    create_correlation_matrix
-)
+# The chart builders (and plotly behind them) are imported lazily inside
+# the display functions, so widget-only reruns before the first analysis
+# never pay the plotly import
 
 # Page configuration
 st.set_page_config(
@@ -37,6 +34,78 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Display formats for the numeric top-signals tables; formatting happens
+# in the browser so the numeric columns serialize to Arrow zero-copy
+_SIGNAL_TABLE_COLUMN_CONFIG = {
+    'Price': st.column_config.NumberColumn(format="₹%.2f"),
+    'MACD': st.column_config.NumberColumn(format="%.4f"),
+    'MFI': st.column_config.NumberColumn(format="%.1f"),
+    'Doji': st.column_config.CheckboxColumn()
+}
+
+# Portfolio metric-card and per-stock signal-card HTML, precompiled once
+# per import; rendering fills in the counts instead of rebuilding the
+# markup on every rerun
+_METRIC_CARD_TEMPLATES = {
+    'BUY': """
+    <div class="metric-card">
+        <h3 style="color: #22c55e;">BUY SIGNALS</h3>
+        <h1>{count}</h1>
+    </div>
+    """,
+    'SELL': """
+    <div class="metric-card">
+        <h3 style="color: #ef4444;">SELL SIGNALS</h3>
+        <h1>{count}</h1>
+    </div>
+    """,
+    'HOLD': """
+    <div class="metric-card">
+        <h3 style="color: #9ca3af;">HOLD</h3>
+        <h1>{count}</h1>
+    </div>
+    """,
+    'TOTAL': """
+    <div class="metric-card">
+        <h3 style="color: #3b82f6;">TOTAL ANALYZED</h3>
+        <h1>{count}</h1>
+    </div>
+    """
+}
+
+_SIGNAL_CARD_TEMPLATES = {
+    'BUY': """
+    <div class="signal-buy">
+        <h3>🟢 {signal}</h3>
+        <p>Strength: {strength}/3</p>
+    </div>
+    """,
+    'SELL': """
+    <div class="signal-sell">
+        <h3>🔴 {signal}</h3>
+        <p>Strength: {strength}/3</p>
+    </div>
+    """,
+    'HOLD': """
+    <div class="signal-neutral">
+        <h3>⚫ {signal}</h3>
+        <p>No Signal</p>
+    </div>
+    """
+}
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: lambda df: pd.util.hash_pandas_object(df).sum()})
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a table for download through pyarrow's C CSV writer.
+
+    The download buttons re-render on every rerun; caching on a content
+    hash means each table is only stringified when it actually changes.
+    """
+    sink = io.BytesIO()
+    pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), sink)
+    return sink.getvalue()
+
 # Custom CSS
 st.markdown("""
 <style>
@@ -155,10 +224,6 @@ def main():
         help="Automatically refresh analysis every 10 minutes"
     )
     
-    if auto_refresh:
-        time.sleep(600)  # 10 minutes
-        st.rerun()
-    
     # Initialize session state
     if 'stock_data' not in st.session_state:
         st.session_state.stock_data = {}
@@ -166,11 +231,27 @@ def main():
         st.session_state.analysis_results = {}
     if 'last_analysis_time' not in st.session_state:
         st.session_state.last_analysis_time = None
-    
-    # Run analysis
-    if analyze_button or (not st.session_state.stock_data):
+
+    # With auto-refresh enabled, only the analysis scope reruns every 10
+    # minutes; the old time.sleep(600) + st.rerun() pinned the worker
+    # thread for the whole wait and froze every widget meanwhile
+    if auto_refresh:
+        render_results = st.fragment(run_every=timedelta(minutes=10))(_run_and_display)
+    else:
+        render_results = _run_and_display
+
+    render_results(num_stocks, period, interval, doji_threshold, mfi_oversold,
+                   mfi_overbought, force_run=analyze_button or auto_refresh)
+
+def _run_and_display(num_stocks, period, interval, doji_threshold, mfi_oversold,
+                     mfi_overbought, force_run=False):
+    """Run the pipeline when needed and show results. Run as a fragment when auto-refresh is on."""
+
+    # Refresh ticks re-enter here with force_run=True; the cached
+    # fetch/analyze layers make that cheap until their TTLs expire
+    if force_run or (not st.session_state.stock_data):
         run_analysis(num_stocks, period, interval, doji_threshold, mfi_oversold, mfi_overbought)
-    
+
     # Display results
     if st.session_state.analysis_results:
         display_analysis_results()
@@ -216,13 +297,18 @@ def run_analysis(num_stocks, period, interval, doji_threshold, mfi_oversold, mfi
 
 def display_analysis_results():
     """Display comprehensive analysis results."""
+    # Deferred so plotly is only imported once there are results to chart
+    from multi_stock_visualizations import create_portfolio_overview_chart, create_signal_strength_heatmap
+
     
     analysis_results = st.session_state.analysis_results
-    stock_data = st.session_state.stock_data
-    
-    # Analysis timestamp
+
+    # Analysis timestamp; the download filenames reuse it so all three
+    # exports carry the analysis time rather than drifting rerun times
+    last_analysis_time = st.session_state.last_analysis_time or datetime.now()
+    file_ts = last_analysis_time.strftime('%Y%m%d_%H%M%S')
     if st.session_state.last_analysis_time:
-        st.caption(f"Last analyzed: {st.session_state.last_analysis_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        st.caption(f"Last analyzed: {last_analysis_time.strftime('%Y-%m-%d %H:%M:%S')}")
     
     # Portfolio overview
     st.header("📊 Portfolio Overview")
@@ -233,37 +319,20 @@ def display_analysis_results():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3 style="color: #22c55e;">BUY SIGNALS</h3>
-            <h1>{portfolio_signals['BUY']}</h1>
-        </div>
-        """, unsafe_allow_html=True)
-    
+        st.markdown(_METRIC_CARD_TEMPLATES['BUY'].format(count=portfolio_signals['BUY']),
+                    unsafe_allow_html=True)
+
     with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3 style="color: #ef4444;">SELL SIGNALS</h3>
-            <h1>{portfolio_signals['SELL']}</h1>
-        </div>
-        """, unsafe_allow_html=True)
-    
+        st.markdown(_METRIC_CARD_TEMPLATES['SELL'].format(count=portfolio_signals['SELL']),
+                    unsafe_allow_html=True)
+
     with col3:
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3 style="color: #9ca3af;">HOLD</h3>
-            <h1>{portfolio_signals['HOLD']}</h1>
-        </div>
-        """, unsafe_allow_html=True)
-    
+        st.markdown(_METRIC_CARD_TEMPLATES['HOLD'].format(count=portfolio_signals['HOLD']),
+                    unsafe_allow_html=True)
+
     with col4:
-        total_analyzed = sum(portfolio_signals.values())
-        st.markdown(f"""
-        <div class="metric-card">
-            <h3 style="color: #3b82f6;">TOTAL ANALYZED</h3>
-            <h1>{total_analyzed}</h1>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_METRIC_CARD_TEMPLATES['TOTAL'].format(count=sum(portfolio_signals.values())),
+                    unsafe_allow_html=True)
     
     # Portfolio charts
     col1, col2 = st.columns(2)
@@ -286,9 +355,15 @@ def display_analysis_results():
         "📊 Individual Stocks"
     ])
     
+    # Build the signals summary and the list of cleanly analyzed stocks
+    # once per rerun; the tab renderers reuse them instead of each
+    # re-walking the results dict
+    signals_df = create_signals_summary(analysis_results)
+    valid_symbols = tuple(s for s, r in analysis_results.items() if 'error' not in r)
+
     with tab1:
-        display_top_signals(analysis_results)
-    
+        display_top_signals(analysis_results, signals_df, file_ts)
+
     with tab2:
         display_sector_analysis(analysis_results)
     
@@ -299,13 +374,15 @@ def display_analysis_results():
         display_correlation_analysis(analysis_results)
     
     with tab5:
-        display_all_signals(analysis_results)
+        display_all_signals(signals_df)
     
     with tab6:
-        display_individual_stock_analysis(analysis_results, stock_data)
+        display_individual_stock_analysis(analysis_results, valid_symbols)
 
-def display_top_signals(analysis_results):
+def display_top_signals(analysis_results, signals_df, file_ts):
     """Display top trading signals."""
+    from multi_stock_visualizations import create_top_signals_table
+
     
     st.subheader("🎯 Top Trading Signals")
     
@@ -315,7 +392,8 @@ def display_top_signals(analysis_results):
         st.markdown("### 🟢 Top BUY Signals")
         buy_table = create_top_signals_table(analysis_results, 'BUY', 10)
         if not buy_table.empty:
-            st.dataframe(buy_table, use_container_width=True, hide_index=True)
+            st.dataframe(buy_table, use_container_width=True, hide_index=True,
+                         column_config=_SIGNAL_TABLE_COLUMN_CONFIG)
         else:
             st.info("No BUY signals found")
     
@@ -323,7 +401,8 @@ def display_top_signals(analysis_results):
         st.markdown("### 🔴 Top SELL Signals")
         sell_table = create_top_signals_table(analysis_results, 'SELL', 10)
         if not sell_table.empty:
-            st.dataframe(sell_table, use_container_width=True, hide_index=True)
+            st.dataframe(sell_table, use_container_width=True, hide_index=True,
+                         column_config=_SIGNAL_TABLE_COLUMN_CONFIG)
         else:
             st.info("No SELL signals found")
     
@@ -334,37 +413,38 @@ def display_top_signals(analysis_results):
     
     with col1:
         if not buy_table.empty:
-            csv_buy = buy_table.to_csv(index=False)
+            csv_buy = _df_to_csv_bytes(buy_table)
             st.download_button(
                 label="Download BUY Signals",
                 data=csv_buy,
-                file_name=f"buy_signals_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                file_name=f"buy_signals_{file_ts}.csv",
                 mime="text/csv"
             )
     
     with col2:
         if not sell_table.empty:
-            csv_sell = sell_table.to_csv(index=False)
+            csv_sell = _df_to_csv_bytes(sell_table)
             st.download_button(
                 label="Download SELL Signals", 
                 data=csv_sell,
-                file_name=f"sell_signals_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                file_name=f"sell_signals_{file_ts}.csv",
                 mime="text/csv"
             )
     
     with col3:
-        all_signals = create_signals_summary(analysis_results)
-        if not all_signals.empty:
-            csv_all = all_signals.to_csv(index=False)
+        if not signals_df.empty:
+            csv_all = _df_to_csv_bytes(signals_df)
             st.download_button(
                 label="Download All Signals",
                 data=csv_all,
-                file_name=f"all_signals_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                file_name=f"all_signals_{file_ts}.csv",
                 mime="text/csv"
             )
 
 def display_sector_analysis(analysis_results):
     """Display sector-wise analysis."""
+    from multi_stock_visualizations import create_sector_analysis_chart
+
     
     st.subheader("🏭 Sector Analysis")
     
@@ -378,25 +458,27 @@ def display_sector_analysis(analysis_results):
         # Sector details
         st.subheader("📊 Sector Details")
         
-        sector_data = []
-        for sector, data in sector_performance.items():
-            sector_data.append({
-                'Sector': sector,
-                'Total Stocks': data['total_stocks'],
-                'BUY Signals': data['buy_signals'],
-                'SELL Signals': data['sell_signals'],
-                'HOLD': data['hold_signals'],
-                'Avg Strength': round(data['avg_strength'], 2),
-                'Signal Rate %': round((data['buy_signals'] + data['sell_signals']) / data['total_stocks'] * 100, 1)
-            })
-        
-        sector_df = pd.DataFrame(sector_data)
+        # One columnar construction plus vectorized arithmetic instead of
+        # appending a dict per sector and rounding row by row
+        raw = pd.DataFrame.from_dict(sector_performance, orient='index')
+        sector_df = pd.DataFrame({
+            'Sector': raw.index,
+            'Total Stocks': raw['total_stocks'],
+            'BUY Signals': raw['buy_signals'],
+            'SELL Signals': raw['sell_signals'],
+            'HOLD': raw['hold_signals'],
+            'Avg Strength': raw['avg_strength'].round(2),
+            'Signal Rate %': ((raw['buy_signals'] + raw['sell_signals'])
+                              / raw['total_stocks'] * 100).round(1)
+        }).reset_index(drop=True)
         st.dataframe(sector_df, use_container_width=True, hide_index=True)
     else:
         st.info("No sector data available")
 
 def display_mfi_macd_analysis(analysis_results):
     """Display MFI vs MACD analysis."""
+    from multi_stock_visualizations import create_mfi_macd_scatter
+
     
     st.subheader("📈 MFI vs MACD Analysis")
     
@@ -406,52 +488,57 @@ def display_mfi_macd_analysis(analysis_results):
     # Analysis insights
     st.subheader("💡 Key Insights")
     
-    # Calculate insights
-    mfi_oversold_count = sum(1 for result in analysis_results.values() 
-                           if 'error' not in result and result['latest_signal'] is not None 
-                           and result['latest_signal']['mfi'] < 30)
-    
-    mfi_overbought_count = sum(1 for result in analysis_results.values()
-                             if 'error' not in result and result['latest_signal'] is not None
-                             and result['latest_signal']['mfi'] > 70)
-    
-    macd_positive_count = sum(1 for result in analysis_results.values()
-                            if 'error' not in result and result['latest_signal'] is not None
-                            and result['latest_signal']['macd'] > 0)
-    
-    total_stocks = len([r for r in analysis_results.values() if 'error' not in r])
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("MFI Oversold Stocks", mfi_oversold_count)
-        
-    with col2:
-        st.metric("MFI Overbought Stocks", mfi_overbought_count)
-        
-    with col3:
-        st.metric("MACD Positive", macd_positive_count)
-    
-    # Detailed insights
-    st.write(f"• **{(mfi_oversold_count/total_stocks*100):.1f}%** of stocks are in oversold territory (MFI < 30)")
-    st.write(f"• **{(mfi_overbought_count/total_stocks*100):.1f}%** of stocks are in overbought territory (MFI > 70)")
-    st.write(f"• **{(macd_positive_count/total_stocks*100):.1f}%** of stocks have positive MACD")
+    # Calculate insights: one pass over the results collecting (MFI, MACD)
+    # pairs, then boolean reductions, instead of four separate dict scans
+    latest_metrics = np.array([
+        (result['latest_signal']['mfi'], result['latest_signal']['macd'])
+        for result in analysis_results.values()
+        if 'error' not in result and result['latest_signal'] is not None
+    ], dtype=np.float64).reshape(-1, 2)
+
+    mfi_values = latest_metrics[:, 0]
+    macd_values = latest_metrics[:, 1]
+
+    mfi_oversold_count = int((mfi_values < 30).sum())
+    mfi_overbought_count = int((mfi_values > 70).sum())
+    macd_positive_count = int((macd_values > 0).sum())
+
+    total_stocks = len(latest_metrics)
+    pct = 100.0 / total_stocks if total_stocks else 0.0
+
+    # One dataframe and one markdown call instead of three metrics plus
+    # three writes; each Streamlit call is a separate message to the browser
+    st.dataframe(
+        pd.DataFrame({
+            'MFI Oversold Stocks': [mfi_oversold_count],
+            'MFI Overbought Stocks': [mfi_overbought_count],
+            'MACD Positive': [macd_positive_count],
+        }),
+        hide_index=True,
+        use_container_width=True
+    )
+
+    st.markdown(
+        f"• **{mfi_oversold_count * pct:.1f}%** of stocks are in oversold territory (MFI < 30)\n\n"
+        f"• **{mfi_overbought_count * pct:.1f}%** of stocks are in overbought territory (MFI > 70)\n\n"
+        f"• **{macd_positive_count * pct:.1f}%** of stocks have positive MACD"
+    )
 
 def display_correlation_analysis(analysis_results):
     """Display correlation analysis."""
+    from multi_stock_visualizations import create_correlation_matrix
+
     
     st.subheader("🔗 Indicator Correlations")
     
     corr_chart = create_correlation_matrix(analysis_results)
     st.plotly_chart(corr_chart, use_container_width=True)
 
-def display_all_signals(analysis_results):
+def display_all_signals(all_signals):
     """Display all signals summary."""
-    
+
     st.subheader("📋 Complete Signals Summary")
-    
-    all_signals = create_signals_summary(analysis_results)
-    
+
     if not all_signals.empty:
         # Add filters
         col1, col2, col3 = st.columns(3)
@@ -465,13 +552,12 @@ def display_all_signals(analysis_results):
         with col3:
             sort_by = st.selectbox("Sort by:", ["Signal", "Strength", "Stock", "MFI", "Price"])
         
-        # Apply filters
-        filtered_df = all_signals.copy()
-        
+        # Apply filters with one combined mask and a single slice; the old
+        # path copied the full frame and then sliced it up to twice more
+        mask = all_signals['Strength'] >= min_strength
         if signal_filter != "All":
-            filtered_df = filtered_df[filtered_df['Signal'] == signal_filter]
-        
-        filtered_df = filtered_df[filtered_df['Strength'] >= min_strength]
+            mask &= all_signals['Signal'] == signal_filter
+        filtered_df = all_signals[mask]
         
         if sort_by == "Strength":
             filtered_df = filtered_df.sort_values('Strength', ascending=False)
@@ -493,7 +579,7 @@ def display_all_signals(analysis_results):
             st.metric("Avg Signal Strength", f"{avg_strength:.2f}")
         
         with col3:
-            doji_count = len(filtered_df[filtered_df['Is_Doji'] == '✓'])
+            doji_count = int(filtered_df['Is_Doji'].sum())
             st.metric("Doji Patterns", doji_count)
         
         with col4:
@@ -503,14 +589,13 @@ def display_all_signals(analysis_results):
     else:
         st.info("No signal data available")
 
-def display_individual_stock_analysis(analysis_results, stock_data):
+def display_individual_stock_analysis(analysis_results, available_stocks):
     """Display individual stock analysis."""
-    
+    from multi_stock_visualizations import create_individual_stock_chart
+
+
     st.subheader("📊 Individual Stock Analysis")
-    
-    # Stock selection
-    available_stocks = [stock for stock in analysis_results.keys() if 'error' not in analysis_results[stock]]
-    
+
     if available_stocks:
         selected_stock = st.selectbox(
             "Select stock to analyze in detail:",
@@ -531,28 +616,12 @@ def display_individual_stock_analysis(analysis_results, stock_data):
                 with col1:
                     signal_type = latest_signal['signal']
                     signal_strength = abs(latest_signal['strength'])
-                    
-                    if signal_type == 'BUY':
-                        st.markdown(f"""
-                        <div class="signal-buy">
-                            <h3>🟢 {signal_type}</h3>
-                            <p>Strength: {signal_strength}/3</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    elif signal_type == 'SELL':
-                        st.markdown(f"""
-                        <div class="signal-sell">
-                            <h3>🔴 {signal_type}</h3>
-                            <p>Strength: {signal_strength}/3</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    else:
-                        st.markdown(f"""
-                        <div class="signal-neutral">
-                            <h3>⚫ {signal_type}</h3>
-                            <p>No Signal</p>
-                        </div>
-                        """, unsafe_allow_html=True)
+
+                    card = _SIGNAL_CARD_TEMPLATES.get(signal_type, _SIGNAL_CARD_TEMPLATES['HOLD'])
+                    st.markdown(
+                        card.format(signal=signal_type, strength=signal_strength),
+                        unsafe_allow_html=True
+                    )
                 
                 with col2:
                     st.metric("Current Price", f"₹{latest_signal['close_price']:.2f}")
@@ -93,39 +93,59 @@ def get_top_fno_stocks(top_n: int = 50):
     Returns:
         dict: Dictionary with top N stocks
     """
-    stocks = get_nifty50_stocks()
     # Return top N stocks (all are FNO eligible in Nifty 50)
-    return dict(list(stocks.items())[:min(top_n, len(stocks))])
+    return dict(_NIFTY50_ITEMS[:min(top_n, len(_NIFTY50_ITEMS))])
+
+# Static views computed once at import; the stock list never changes at
+# runtime, so slicing these beats rebuilding item lists per call
+_NIFTY50_ITEMS = tuple(NIFTY50_STOCKS.items())
+_NIFTY50_SYMBOLS = tuple(NIFTY50_STOCKS.values())
+
+def get_top_fno_symbols(top_n: int = 50):
+    """
+    Get Yahoo Finance symbols of the top N FNO stocks from Nifty 50.
+
+    Args:
+        top_n (int): Number of top stocks to return
+
+    Returns:
+        tuple: Yahoo Finance symbols of the top N stocks
+    """
+    return _NIFTY50_SYMBOLS[:min(top_n, len(_NIFTY50_SYMBOLS))]
+
+# Sector grouping built once at import; get_sector_wise_stocks used to
+# rebuild this dict of lists on every call (once per sector-analysis rerun)
+SECTOR_WISE_STOCKS = {
+    'Technology': ['TCS', 'INFY', 'HCLTECH', 'WIPRO', 'TECHM', 'LTIM'],
+    'Banking & Financial Services': [
+        'HDFCBANK', 'ICICIBANK', 'KOTAKBANK', 'AXISBANK', 'SBIN',
+        'HDFCLIFE', 'SBILIFE', 'BAJFINANCE', 'BAJAJFINSV'
+    ],
+    'Consumer Goods': [
+        'RELIANCE', 'ITC', 'HINDUNILVR', 'NESTLEIND', 'BRITANNIA',
+        'DABUR', 'GODREJCP', 'TATACONSUM'
+    ],
+    'Automobiles': [
+        'MARUTI', 'M&M', 'TATAMOTORS', 'BAJAJ-AUTO', 'EICHERMOT', 'HEROMOTOCO'
+    ],
+    'Pharmaceuticals': [
+        'SUNPHARMA', 'DRREDDY', 'CIPLA', 'DIVISLAB', 'APOLLOHOSP'
+    ],
+    'Metals & Mining': [
+        'TATASTEEL', 'JSWSTEEL', 'HINDALCO', 'ADANIENT', 'COALINDIA'
+    ],
+    'Energy & Power': [
+        'ONGC', 'POWERGRID', 'NTPC', 'BPCL', 'IOC', 'ADANIPORTS'
+    ],
+    'Telecom': ['BHARTIARTL'],
+    'Infrastructure & Others': ['LT', 'ULTRACEMCO', 'GRASIM', 'ASIANPAINT']
+}
 
 def get_sector_wise_stocks():
     """
     Returns stocks grouped by sectors.
-    
+
     Returns:
         dict: Dictionary with sectors as keys and stock lists as values
     """
-    return {
-        'Technology': ['TCS', 'INFY', 'HCLTECH', 'WIPRO', 'TECHM', 'LTIM'],
-        'Banking & Financial Services': [
-            'HDFCBANK', 'ICICIBANK', 'KOTAKBANK', 'AXISBANK', 'SBIN', 
-            'HDFCLIFE', 'SBILIFE', 'BAJFINANCE', 'BAJAJFINSV'
-        ],
-        'Consumer Goods': [
-            'RELIANCE', 'ITC', 'HINDUNILVR', 'NESTLEIND', 'BRITANNIA', 
-            'DABUR', 'GODREJCP', 'TATACONSUM'
-        ],
-        'Automobiles': [
-            'MARUTI', 'M&M', 'TATAMOTORS', 'BAJAJ-AUTO', 'EICHERMOT', 'HEROMOTOCO'
-        ],
-        'Pharmaceuticals': [
-            'SUNPHARMA', 'DRREDDY', 'CIPLA', 'DIVISLAB', 'APOLLOHOSP'
-        ],
-        'Metals & Mining': [
-            'TATASTEEL', 'JSWSTEEL', 'HINDALCO', 'ADANIENT', 'COALINDIA'
-        ],
-        'Energy & Power': [
-            'ONGC', 'POWERGRID', 'NTPC', 'BPCL', 'IOC', 'ADANIPORTS'
-        ],
-        'Telecom': ['BHARTIARTL'],
-        'Infrastructure & Others': ['LT', 'ULTRACEMCO', 'GRASIM', 'ASIANPAINT']
-    }
\ No newline at end of file
+    return SECTOR_WISE_STOCKS
\ No newline at end of file
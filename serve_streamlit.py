@@ -3,16 +3,8 @@ import subprocess
 from pathlib import Path
 import modal
 
-# Define container dependencies
-image = modal.Image.debian_slim(python_version="3.11").pip_install(
-    "streamlit~=1.48.0",
-    "yfinance~=0.2.65",
-    "pandas~=2.3.1", 
-    "numpy~=2.3.2",
-    "plotly~=6.3.0",
-    "ta-lib~=0.6.5",
-    "scikit-learn~=1.7.1"
-)
+# Container dependencies shared with serve_nifty50_app.py
+from modal_common import BASE_IMAGE as image
 
 app = modal.App(name="nifty-trading-analyzer", image=image)
 
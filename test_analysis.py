@@ -4,6 +4,7 @@ Simple test script for multi-stock analysis without Streamlit dependencies
 
 import yfinance as yf
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from trading_indicators import calculate_all_indicators
 
@@ -21,19 +22,13 @@ def test_single_stock():
     
     # Prepare data
     data.reset_index(inplace=True)
-    
+
     print(f"Data columns: {list(data.columns)}")
     print(f"Data shape: {data.shape}")
-    
-    # Remove unnecessary columns
-    cols_to_remove = ['Dividends', 'Stock Splits', 'Adj Close']
-    for col in cols_to_remove:
-        if col in data.columns:
-            data = data.drop(col, axis=1)
-    
-    # Rename Date to Datetime if needed
-    if 'Date' in data.columns:
-        data = data.rename(columns={'Date': 'Datetime'})
+
+    # Remove unnecessary columns and normalize the datetime column name
+    data = (data.drop(columns=['Dividends', 'Stock Splits', 'Adj Close'], errors='ignore')
+                .rename(columns={'Date': 'Datetime'}))
     
     # Ensure required columns exist
     required_cols = ['Datetime', 'Open', 'High', 'Low', 'Close', 'Volume']
@@ -92,46 +87,66 @@ def test_multiple_stocks():
     
     stocks = ['TCS.NS', 'INFY.NS', 'RELIANCE.NS']
     results = {}
-    
+
+    # One batched request instead of a Ticker().history() call per symbol
+    try:
+        batch = yf.download(
+            tickers=stocks,
+            period="1mo",
+            interval="1d",
+            group_by='ticker',
+            threads=True,
+            progress=False,
+        )
+    except Exception as e:
+        print(f"❌ Batch download failed: {str(e)}")
+        return False
+
+    multi_symbol = isinstance(batch.columns, pd.MultiIndex)
+
+    def analyze_one(stock):
+        data = batch[stock] if multi_symbol else batch
+        data = data.dropna(how='all')
+
+        if data.empty:
+            return None
+
+        # Prepare data: drop the unneeded columns in one call and
+        # normalize the datetime column name
+        data = (data.reset_index()
+                    .drop(columns=['Dividends', 'Stock Splits', 'Adj Close'], errors='ignore')
+                    .rename(columns={'Date': 'Datetime'}))
+
+        # Analyze
+        return calculate_all_indicators(data)
+
+    # Run the indicator pipeline for all stocks in a thread pool; the
+    # numba kernels release the GIL, so the per-stock passes overlap
+    with ThreadPoolExecutor(max_workers=len(stocks)) as executor:
+        futures = {stock: executor.submit(analyze_one, stock) for stock in stocks}
+
     for stock in stocks:
+        stock_name = stock.replace('.NS', '')
         try:
-            ticker = yf.Ticker(stock)
-            data = ticker.history(period="1mo", interval="1d")
-            
-            if not data.empty:
-                # Prepare data
-                data.reset_index(inplace=True)
-                
-                # Remove unnecessary columns
-                cols_to_remove = ['Dividends', 'Stock Splits', 'Adj Close']
-                for col in cols_to_remove:
-                    if col in data.columns:
-                        data = data.drop(col, axis=1)
-                
-                # Rename Date to Datetime if needed
-                if 'Date' in data.columns:
-                    data = data.rename(columns={'Date': 'Datetime'})
-                
-                # Analyze
-                analysis_result = calculate_all_indicators(data)
-                
-                if not analysis_result.empty:
-                    latest = analysis_result.iloc[-1]
-                    results[stock.replace('.NS', '')] = {
-                        'signal': latest['Signal'],
-                        'strength': latest['Signal_Strength'],
-                        'price': latest['Close'],
-                        'mfi': latest['MFI'],
-                        'is_doji': latest['Is_Doji']
-                    }
-                    print(f"✅ {stock.replace('.NS', '')}: {latest['Signal']} (Strength: {abs(latest['Signal_Strength'])})")
-                else:
-                    print(f"❌ {stock.replace('.NS', '')}: No analysis results")
+            analysis_result = futures[stock].result()
+
+            if analysis_result is None:
+                print(f"❌ {stock_name}: No data")
+            elif not analysis_result.empty:
+                latest = analysis_result.iloc[-1]
+                results[stock_name] = {
+                    'signal': latest['Signal'],
+                    'strength': latest['Signal_Strength'],
+                    'price': latest['Close'],
+                    'mfi': latest['MFI'],
+                    'is_doji': latest['Is_Doji']
+                }
+                print(f"✅ {stock_name}: {latest['Signal']} (Strength: {abs(latest['Signal_Strength'])})")
             else:
-                print(f"❌ {stock.replace('.NS', '')}: No data")
-                
+                print(f"❌ {stock_name}: No analysis results")
+
         except Exception as e:
-            print(f"❌ {stock.replace('.NS', '')}: Error - {str(e)}")
+            print(f"❌ {stock_name}: Error - {str(e)}")
     
     # Summary
     if results:
@@ -7,35 +7,58 @@ import pandas as pd
 import numpy as np
 from typing import Tuple, Dict, Any
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the plain-Python kernel still works
+    njit = None
+
+
+def _ha_open_recurrence(ha_open: np.ndarray, ha_close: np.ndarray) -> np.ndarray:
+    """Fill HA_Open in place from the previous candle's HA_Open/HA_Close."""
+    for i in range(1, ha_open.shape[0]):
+        ha_open[i] = (ha_open[i - 1] + ha_close[i - 1]) / 2.0
+    return ha_open
+
+
+# nogil lets the per-stock analysis threads run the recurrence
+# concurrently instead of serializing on the interpreter lock
+if njit is not None:
+    _ha_open_recurrence = njit(cache=True, nogil=True)(_ha_open_recurrence)
+
 
 def calculate_heikinashi(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate Heikin-Ashi candles from regular OHLC data.
-    
+
     Args:
         df: DataFrame with OHLC data (Open, High, Low, Close columns)
-        
+
     Returns:
         DataFrame with Heikin-Ashi OHLC values
     """
-    ha_df = df.copy()
-    
-    # Calculate Heikin-Ashi values
-    ha_df['HA_Close'] = (df['Open'] + df['High'] + df['Low'] + df['Close']) / 4
-    
-    # Initialize first HA_Open
-    ha_df.loc[ha_df.index[0], 'HA_Open'] = (df.loc[df.index[0], 'Open'] + df.loc[df.index[0], 'Close']) / 2
-    
-    # Calculate subsequent HA_Open values
-    for i in range(1, len(ha_df)):
-        ha_df.loc[ha_df.index[i], 'HA_Open'] = (
-            ha_df.loc[ha_df.index[i-1], 'HA_Open'] + ha_df.loc[ha_df.index[i-1], 'HA_Close']
-        ) / 2
-    
-    # Calculate HA_High and HA_Low
-    ha_df['HA_High'] = ha_df[['High', 'HA_Open', 'HA_Close']].max(axis=1)
-    ha_df['HA_Low'] = ha_df[['Low', 'HA_Open', 'HA_Close']].min(axis=1)
-    
+    # Work on contiguous NumPy arrays; per-row .loc access is orders of
+    # magnitude slower for the sequential HA_Open recurrence. float32 gives
+    # plenty of precision for price levels and halves memory traffic.
+    open_arr = df['Open'].to_numpy(dtype=np.float32)
+    high_arr = df['High'].to_numpy(dtype=np.float32)
+    low_arr = df['Low'].to_numpy(dtype=np.float32)
+    close_arr = df['Close'].to_numpy(dtype=np.float32)
+
+    ha_close = (open_arr + high_arr + low_arr + close_arr) / 4
+
+    ha_open = np.empty_like(ha_close)
+    ha_open[0] = (open_arr[0] + close_arr[0]) / 2
+    _ha_open_recurrence(ha_open, ha_close)
+
+    # Shallow copy: the input's OHLC blocks are shared, not duplicated.
+    # Only brand-new columns are added below, so nothing propagates back
+    # to the caller's frame.
+    ha_df = df.copy(deep=False)
+    ha_df['HA_Close'] = ha_close
+    ha_df['HA_Open'] = ha_open
+    ha_df['HA_High'] = np.maximum(high_arr, np.maximum(ha_open, ha_close))
+    ha_df['HA_Low'] = np.minimum(low_arr, np.minimum(ha_open, ha_close))
+
     return ha_df
 
 
@@ -74,35 +97,48 @@ def calculate_mfi(df: pd.DataFrame, period: int = 14) -> pd.Series:
     Returns:
         Series with MFI values
     """
-    # Calculate typical price
-    typical_price = (df['High'] + df['Low'] + df['Close']) / 3
-    
-    # Calculate money flow
-    money_flow = typical_price * df['Volume']
-    
-    # Calculate positive and negative money flow
-    price_change = typical_price.diff()
-    
-    positive_flow = pd.Series(0.0, index=df.index)
-    negative_flow = pd.Series(0.0, index=df.index)
-    
-    positive_mask = price_change > 0
-    negative_mask = price_change < 0
-    
-    positive_flow[positive_mask] = money_flow[positive_mask]
-    negative_flow[negative_mask] = money_flow[negative_mask]
-    
-    # Calculate money flow ratio and MFI
-    positive_flow_sum = positive_flow.rolling(window=period).sum()
-    negative_flow_sum = negative_flow.rolling(window=period).sum()
-    
+    high_arr = df['High'].to_numpy(dtype=np.float32)
+    low_arr = df['Low'].to_numpy(dtype=np.float32)
+    close_arr = df['Close'].to_numpy(dtype=np.float32)
+    volume_arr = df['Volume'].to_numpy(dtype=np.float32)
+    n = len(df)
+
+    # Calculate typical price and money flow
+    typical_price = (high_arr + low_arr + close_arr) / 3
+    money_flow = typical_price * volume_arr
+
+    # Split into positive and negative flow by the typical-price change
+    # (the first bar has no change and contributes to neither side)
+    price_change = np.empty(n, dtype=np.float32)
+    price_change[0] = 0.0
+    np.subtract(typical_price[1:], typical_price[:-1], out=price_change[1:])
+
+    positive_flow = np.where(price_change > 0, money_flow, np.float32(0.0))
+    negative_flow = np.where(price_change < 0, money_flow, np.float32(0.0))
+
+    # Rolling sums as cumulative-sum differences: one O(N) pass per side
+    # instead of pandas' windowed rolling machinery. The running sums
+    # accumulate in float64 so long histories don't lose precision.
+    positive_flow_sum = np.full(n, np.nan)
+    negative_flow_sum = np.full(n, np.nan)
+
+    if n >= period:
+        positive_cumsum = np.cumsum(positive_flow, dtype=np.float64)
+        negative_cumsum = np.cumsum(negative_flow, dtype=np.float64)
+
+        positive_flow_sum[period - 1] = positive_cumsum[period - 1]
+        negative_flow_sum[period - 1] = negative_cumsum[period - 1]
+        positive_flow_sum[period:] = positive_cumsum[period:] - positive_cumsum[:-period]
+        negative_flow_sum[period:] = negative_cumsum[period:] - negative_cumsum[:-period]
+
     # Avoid division by zero
-    money_ratio = np.where(negative_flow_sum != 0, 
-                          positive_flow_sum / negative_flow_sum, 
-                          100.0)
-    
-    mfi = 100 - (100 / (1 + money_ratio))
-    
+    with np.errstate(invalid='ignore'):
+        money_ratio = np.where(negative_flow_sum != 0,
+                               positive_flow_sum / negative_flow_sum,
+                               100.0)
+
+    mfi = (100 - (100 / (1 + money_ratio))).astype(np.float32)
+
     return pd.Series(mfi, index=df.index, name='MFI')
 
 
@@ -119,16 +155,18 @@ def calculate_macd(df: pd.DataFrame, fast_period: int = 12, slow_period: int = 2
     Returns:
         Dictionary with MACD line, signal line, and histogram
     """
-    # Calculate EMAs
-    ema_fast = df['Close'].ewm(span=fast_period).mean()
-    ema_slow = df['Close'].ewm(span=slow_period).mean()
-    
+    # Calculate EMAs (pandas computes ewm in float64 internally; results
+    # are narrowed back to float32 to match the other indicator columns)
+    close = df['Close']
+    ema_fast = close.ewm(span=fast_period).mean()
+    ema_slow = close.ewm(span=slow_period).mean()
+
     # Calculate MACD line
-    macd_line = ema_fast - ema_slow
-    
+    macd_line = (ema_fast - ema_slow).astype(np.float32)
+
     # Calculate signal line
-    signal_line = macd_line.ewm(span=signal_period).mean()
-    
+    signal_line = macd_line.ewm(span=signal_period).mean().astype(np.float32)
+
     # Calculate MACD histogram
     macd_histogram = macd_line - signal_line
     
@@ -151,20 +189,17 @@ def detect_macd_crossovers(macd_data: Dict[str, pd.Series]) -> Dict[str, pd.Seri
     """
     macd = macd_data['MACD']
     signal = macd_data['MACD_Signal']
-    
-    # Detect crossovers - handle NaN values
-    macd_above_signal = (macd > signal).fillna(False)
-    macd_above_signal_prev = macd_above_signal.shift(1).fillna(False)
-    
-    # Bullish crossover: MACD crosses above signal line
-    bullish_crossover = (~macd_above_signal_prev) & macd_above_signal
-    
-    # Bearish crossover: MACD crosses below signal line  
-    bearish_crossover = macd_above_signal_prev & (~macd_above_signal)
-    
+
+    # One comparison into int8 codes, then the sign of the step between
+    # consecutive codes marks the crossovers: +1 bullish, -1 bearish.
+    # NaNs compare False, matching the old fillna(False) handling, and
+    # prepending the first code makes bar 0 never a crossover.
+    above = (macd.to_numpy() > signal.to_numpy()).astype(np.int8)
+    step = np.diff(above, prepend=above[:1])
+
     return {
-        'MACD_Bullish': bullish_crossover.fillna(False),
-        'MACD_Bearish': bearish_crossover.fillna(False)
+        'MACD_Bullish': pd.Series(step == 1, index=macd.index, name='MACD_Bullish'),
+        'MACD_Bearish': pd.Series(step == -1, index=macd.index, name='MACD_Bearish')
     }
 
 
@@ -180,92 +215,74 @@ def generate_trading_signals(df: pd.DataFrame, mfi_oversold: int = 30, mfi_overb
     Returns:
         DataFrame with trading signals
     """
-    signals_df = df.copy()
-    
-    # Initialize signal columns
-    signals_df['Signal'] = 'HOLD'
-    signals_df['Signal_Strength'] = 0
-    signals_df['Signal_Reason'] = ''
-    
-    # Define conditions
-    doji_condition = signals_df['Is_Doji']
-    mfi_oversold_condition = signals_df['MFI'] < mfi_oversold
-    mfi_overbought_condition = signals_df['MFI'] > mfi_overbought
-    macd_bullish = signals_df['MACD_Bullish']
-    macd_bearish = signals_df['MACD_Bearish']
-    
-    # Generate BUY signals
-    buy_conditions = []
-    buy_reasons = []
-    buy_strengths = []
-    
-    # Strong BUY: Doji + Oversold MFI + MACD Bullish crossover
-    strong_buy = doji_condition & mfi_oversold_condition & macd_bullish
-    buy_conditions.append(strong_buy)
-    buy_reasons.append('Doji + Oversold MFI + MACD Bullish')
-    buy_strengths.append(3)
-    
-    # Medium BUY: Doji + Oversold MFI
-    medium_buy_1 = doji_condition & mfi_oversold_condition & ~macd_bullish
-    buy_conditions.append(medium_buy_1)
-    buy_reasons.append('Doji + Oversold MFI')
-    buy_strengths.append(2)
-    
-    # Medium BUY: Doji + MACD Bullish
-    medium_buy_2 = doji_condition & macd_bullish & ~mfi_oversold_condition
-    buy_conditions.append(medium_buy_2)
-    buy_reasons.append('Doji + MACD Bullish')
-    buy_strengths.append(2)
-    
-    # Weak BUY: Just oversold MFI + MACD Bullish
-    weak_buy = ~doji_condition & mfi_oversold_condition & macd_bullish
-    buy_conditions.append(weak_buy)
-    buy_reasons.append('Oversold MFI + MACD Bullish')
-    buy_strengths.append(1)
-    
-    # Generate SELL signals
-    sell_conditions = []
-    sell_reasons = []
-    sell_strengths = []
-    
-    # Strong SELL: Doji + Overbought MFI + MACD Bearish crossover
-    strong_sell = doji_condition & mfi_overbought_condition & macd_bearish
-    sell_conditions.append(strong_sell)
-    sell_reasons.append('Doji + Overbought MFI + MACD Bearish')
-    sell_strengths.append(-3)
-    
-    # Medium SELL: Doji + Overbought MFI
-    medium_sell_1 = doji_condition & mfi_overbought_condition & ~macd_bearish
-    sell_conditions.append(medium_sell_1)
-    sell_reasons.append('Doji + Overbought MFI')
-    sell_strengths.append(-2)
-    
-    # Medium SELL: Doji + MACD Bearish
-    medium_sell_2 = doji_condition & macd_bearish & ~mfi_overbought_condition
-    sell_conditions.append(medium_sell_2)
-    sell_reasons.append('Doji + MACD Bearish')
-    sell_strengths.append(-2)
-    
-    # Weak SELL: Just overbought MFI + MACD Bearish
-    weak_sell = ~doji_condition & mfi_overbought_condition & macd_bearish
-    sell_conditions.append(weak_sell)
-    sell_reasons.append('Overbought MFI + MACD Bearish')
-    sell_strengths.append(-1)
-    
-    # Apply BUY signals (prioritize stronger signals)
-    for condition, reason, strength in zip(buy_conditions, buy_reasons, buy_strengths):
-        mask = condition & (signals_df['Signal_Strength'] < strength)
-        signals_df.loc[mask, 'Signal'] = 'BUY'
-        signals_df.loc[mask, 'Signal_Strength'] = strength
-        signals_df.loc[mask, 'Signal_Reason'] = reason
-    
-    # Apply SELL signals (prioritize stronger signals)
-    for condition, reason, strength in zip(sell_conditions, sell_reasons, sell_strengths):
-        mask = condition & (signals_df['Signal_Strength'] > strength)
-        signals_df.loc[mask, 'Signal'] = 'SELL'
-        signals_df.loc[mask, 'Signal_Strength'] = strength
-        signals_df.loc[mask, 'Signal_Reason'] = reason
-    
+    # Shallow copy, as in calculate_heikinashi: only the three Signal
+    # columns are added, so the indicator blocks are shared, not duplicated
+    signals_df = df.copy(deep=False)
+
+    # Base conditions as NumPy bool arrays (NaN MFI compares to False)
+    doji_condition = signals_df['Is_Doji'].to_numpy(dtype=bool)
+    mfi = signals_df['MFI'].to_numpy()
+    macd_bullish = signals_df['MACD_Bullish'].to_numpy(dtype=bool)
+    macd_bearish = signals_df['MACD_Bearish'].to_numpy(dtype=bool)
+
+    with np.errstate(invalid='ignore'):
+        mfi_oversold_condition = mfi < mfi_oversold
+        mfi_overbought_condition = mfi > mfi_overbought
+
+    # One np.select pass per output column. SELL conditions come first so
+    # a bar matching both directions resolves to SELL, matching the old
+    # iterative overwrite order; within each direction stronger setups
+    # are listed before weaker ones.
+    conditions = [
+        # Strong SELL: Doji + Overbought MFI + MACD Bearish crossover
+        doji_condition & mfi_overbought_condition & macd_bearish,
+        # Medium SELL: Doji + Overbought MFI
+        doji_condition & mfi_overbought_condition & ~macd_bearish,
+        # Medium SELL: Doji + MACD Bearish
+        doji_condition & macd_bearish & ~mfi_overbought_condition,
+        # Weak SELL: Just overbought MFI + MACD Bearish
+        ~doji_condition & mfi_overbought_condition & macd_bearish,
+        # Strong BUY: Doji + Oversold MFI + MACD Bullish crossover
+        doji_condition & mfi_oversold_condition & macd_bullish,
+        # Medium BUY: Doji + Oversold MFI
+        doji_condition & mfi_oversold_condition & ~macd_bullish,
+        # Medium BUY: Doji + MACD Bullish
+        doji_condition & macd_bullish & ~mfi_oversold_condition,
+        # Weak BUY: Just oversold MFI + MACD Bullish
+        ~doji_condition & mfi_oversold_condition & macd_bullish,
+    ]
+    signal_labels = ['SELL', 'SELL', 'SELL', 'SELL', 'BUY', 'BUY', 'BUY', 'BUY']
+    strengths = [-3, -2, -2, -1, 3, 2, 2, 1]
+    reasons = [
+        'Doji + Overbought MFI + MACD Bearish',
+        'Doji + Overbought MFI',
+        'Doji + MACD Bearish',
+        'Overbought MFI + MACD Bearish',
+        'Doji + Oversold MFI + MACD Bullish',
+        'Doji + Oversold MFI',
+        'Doji + MACD Bullish',
+        'Oversold MFI + MACD Bullish',
+    ]
+
+    # Store signals as int8-coded categories rather than Python object
+    # strings: ~8 bytes/row instead of a pointer per row, and downstream
+    # equality filters compare codes instead of strings
+    signals_df['Signal'] = pd.Categorical(
+        np.select(conditions, signal_labels, default='HOLD'),
+        categories=['BUY', 'HOLD', 'SELL']
+    )
+    signals_df['Signal_Strength'] = np.select(conditions, strengths, default=0).astype(np.int8)
+    # Only nine distinct reason strings exist, so codes beat one Python
+    # string object per row here as well
+    signals_df['Signal_Reason'] = pd.Categorical(
+        np.select(conditions, reasons, default=''),
+        categories=[''] + reasons
+    )
+
+    # Count once while the codes are hot; the chart and table helpers in
+    # visualizations.py read this instead of rescanning the column
+    signals_df.attrs['signal_counts'] = signals_df['Signal'].value_counts().to_dict()
+
     return signals_df
 
 
@@ -5,22 +5,46 @@ Contains functions for creating trading charts and visualizations.
 
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
 import streamlit as st
 from typing import Optional, Dict, Any
 
 
+# Browser render time is linear in plotted points; beyond this many bars
+# the dense traces are thinned before plotting (same budget as the
+# multi-stock charts)
+_MAX_RENDER_POINTS = 2000
+
+def _downsample_for_render(df: pd.DataFrame, max_points: int = _MAX_RENDER_POINTS) -> pd.DataFrame:
+    """
+    Thin a frame to at most max_points evenly strided rows for plotting.
+
+    Strides backwards from the end so the most recent bar is always kept,
+    then restores chronological order.
+    """
+    if len(df) <= max_points:
+        return df
+    step = -(-len(df) // max_points)
+    return df.iloc[::-1].iloc[::step].iloc[::-1]
+
+
 def create_heikinashi_chart(df: pd.DataFrame, show_signals: bool = True) -> go.Figure:
     """
     Create a Heikin-Ashi candlestick chart with trading signals.
-    
+
     Args:
         df: DataFrame with Heikin-Ashi data and signals
         show_signals: Whether to show trading signals on the chart
-        
+
     Returns:
         Plotly figure object
     """
+    # Dense traces draw from the thinned view; the Doji and signal markers
+    # below keep reading the full frame, since those rows are sparse and
+    # striding could drop exactly the bars the chart exists to show
+    view = _downsample_for_render(df)
+
     fig = make_subplots(
         rows=4, cols=1,
         shared_xaxes=True,
@@ -32,11 +56,11 @@ def create_heikinashi_chart(df: pd.DataFrame, show_signals: bool = True) -> go.F
     # Heikin-Ashi Candlesticks
     fig.add_trace(
         go.Candlestick(
-            x=df['Datetime'],
-            open=df['HA_Open'],
-            high=df['HA_High'],
-            low=df['HA_Low'],
-            close=df['HA_Close'],
+            x=view['Datetime'],
+            open=view['HA_Open'],
+            high=view['HA_High'],
+            low=view['HA_Low'],
+            close=view['HA_Close'],
             name='Heikin-Ashi',
             increasing_line_color='#00ff88',
             decreasing_line_color='#ff4444',
@@ -66,65 +90,61 @@ def create_heikinashi_chart(df: pd.DataFrame, show_signals: bool = True) -> go.F
             row=1, col=1
         )
     
-    # Add trading signals
+    # Add trading signals: one trace per direction, with per-point marker
+    # size/color arrays encoding the strength instead of a slice-and-trace
+    # per strength level
     if show_signals:
-        # Buy signals
         buy_signals = df[df['Signal'] == 'BUY']
         if not buy_signals.empty:
-            colors = {1: 'lightgreen', 2: 'green', 3: 'darkgreen'}
-            sizes = {1: 8, 2: 10, 3: 12}
-            
-            for strength in [1, 2, 3]:
-                strength_signals = buy_signals[buy_signals['Signal_Strength'] == strength]
-                if not strength_signals.empty:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=strength_signals['Datetime'],
-                            y=strength_signals['HA_Low'],
-                            mode='markers',
-                            marker=dict(
-                                symbol='triangle-up',
-                                size=sizes[strength],
-                                color=colors[strength],
-                                line=dict(color='white', width=1)
-                            ),
-                            name=f'BUY (Strength {strength})',
-                            hovertext=[f"BUY: {reason}" for reason in strength_signals['Signal_Reason']]
-                        ),
-                        row=1, col=1
-                    )
-        
-        # Sell signals
+            buy_strength = buy_signals['Signal_Strength']
+            fig.add_trace(
+                go.Scatter(
+                    x=buy_signals['Datetime'],
+                    y=buy_signals['HA_Low'],
+                    mode='markers',
+                    marker=dict(
+                        symbol='triangle-up',
+                        size=buy_strength.map({1: 8, 2: 10, 3: 12}).to_numpy(),
+                        color=buy_strength.map({1: 'lightgreen', 2: 'green', 3: 'darkgreen'}).to_numpy(),
+                        line=dict(color='white', width=1)
+                    ),
+                    name='BUY',
+                    hovertext=[
+                        f"BUY (Strength {strength}): {reason}"
+                        for strength, reason in zip(buy_strength, buy_signals['Signal_Reason'])
+                    ]
+                ),
+                row=1, col=1
+            )
+
         sell_signals = df[df['Signal'] == 'SELL']
         if not sell_signals.empty:
-            colors = {-1: 'lightcoral', -2: 'red', -3: 'darkred'}
-            sizes = {-1: 8, -2: 10, -3: 12}
-            
-            for strength in [-1, -2, -3]:
-                strength_signals = sell_signals[sell_signals['Signal_Strength'] == strength]
-                if not strength_signals.empty:
-                    fig.add_trace(
-                        go.Scatter(
-                            x=strength_signals['Datetime'],
-                            y=strength_signals['HA_High'],
-                            mode='markers',
-                            marker=dict(
-                                symbol='triangle-down',
-                                size=sizes[strength],
-                                color=colors[strength],
-                                line=dict(color='white', width=1)
-                            ),
-                            name=f'SELL (Strength {abs(strength)})',
-                            hovertext=[f"SELL: {reason}" for reason in strength_signals['Signal_Reason']]
-                        ),
-                        row=1, col=1
-                    )
+            sell_strength = sell_signals['Signal_Strength']
+            fig.add_trace(
+                go.Scatter(
+                    x=sell_signals['Datetime'],
+                    y=sell_signals['HA_High'],
+                    mode='markers',
+                    marker=dict(
+                        symbol='triangle-down',
+                        size=sell_strength.map({-1: 8, -2: 10, -3: 12}).to_numpy(),
+                        color=sell_strength.map({-1: 'lightcoral', -2: 'red', -3: 'darkred'}).to_numpy(),
+                        line=dict(color='white', width=1)
+                    ),
+                    name='SELL',
+                    hovertext=[
+                        f"SELL (Strength {abs(strength)}): {reason}"
+                        for strength, reason in zip(sell_strength, sell_signals['Signal_Reason'])
+                    ]
+                ),
+                row=1, col=1
+            )
     
     # MACD
     fig.add_trace(
         go.Scatter(
-            x=df['Datetime'],
-            y=df['MACD'],
+            x=view['Datetime'],
+            y=view['MACD'],
             mode='lines',
             name='MACD',
             line=dict(color='blue', width=2)
@@ -134,8 +154,8 @@ def create_heikinashi_chart(df: pd.DataFrame, show_signals: bool = True) -> go.F
     
     fig.add_trace(
         go.Scatter(
-            x=df['Datetime'],
-            y=df['MACD_Signal'],
+            x=view['Datetime'],
+            y=view['MACD_Signal'],
             mode='lines',
             name='Signal',
             line=dict(color='red', width=2)
@@ -143,12 +163,12 @@ def create_heikinashi_chart(df: pd.DataFrame, show_signals: bool = True) -> go.F
         row=2, col=1
     )
     
-    # MACD Histogram
-    colors = ['green' if val >= 0 else 'red' for val in df['MACD_Histogram']]
+    # MACD Histogram (vectorized color pick; plotly takes the ndarray as-is)
+    colors = np.where(view['MACD_Histogram'].to_numpy() >= 0, 'green', 'red')
     fig.add_trace(
         go.Bar(
-            x=df['Datetime'],
-            y=df['MACD_Histogram'],
+            x=view['Datetime'],
+            y=view['MACD_Histogram'],
             name='MACD Histogram',
             marker_color=colors,
             opacity=0.6
@@ -159,8 +179,8 @@ def create_heikinashi_chart(df: pd.DataFrame, show_signals: bool = True) -> go.F
     # MFI
     fig.add_trace(
         go.Scatter(
-            x=df['Datetime'],
-            y=df['MFI'],
+            x=view['Datetime'],
+            y=view['MFI'],
             mode='lines',
             name='MFI',
             line=dict(color='purple', width=2)
@@ -173,13 +193,12 @@ def create_heikinashi_chart(df: pd.DataFrame, show_signals: bool = True) -> go.F
     fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=3, col=1)
     
     # Volume
-    volume_colors = ['green' if close >= open_price else 'red' 
-                    for close, open_price in zip(df['Close'], df['Open'])]
+    volume_colors = np.where(view['Close'].to_numpy() >= view['Open'].to_numpy(), 'green', 'red')
     
     fig.add_trace(
         go.Bar(
-            x=df['Datetime'],
-            y=df['Volume'],
+            x=view['Datetime'],
+            y=view['Volume'],
             name='Volume',
             marker_color=volume_colors,
             opacity=0.6
@@ -227,8 +246,13 @@ def create_signals_summary_chart(df: pd.DataFrame) -> go.Figure:
     Returns:
         Plotly figure object
     """
-    # Count signals by type
-    signal_counts = df['Signal'].value_counts()
+    # Counts are precomputed by generate_trading_signals; fall back to a
+    # scan for frames that arrived some other way
+    cached_counts = df.attrs.get('signal_counts')
+    if cached_counts is not None:
+        signal_counts = pd.Series(cached_counts)
+    else:
+        signal_counts = df['Signal'].value_counts()
     
     # Create pie chart
     fig = go.Figure(data=[
@@ -316,12 +340,16 @@ def create_performance_metrics_table(df: pd.DataFrame) -> pd.DataFrame:
         DataFrame with performance metrics
     """
     metrics = {}
-    
-    # Basic statistics
-    metrics['Total Signals'] = len(df[df['Signal'] != 'HOLD'])
-    metrics['Buy Signals'] = len(df[df['Signal'] == 'BUY'])
-    metrics['Sell Signals'] = len(df[df['Signal'] == 'SELL'])
-    metrics['Hold Periods'] = len(df[df['Signal'] == 'HOLD'])
+
+    # Basic statistics from the counts cached by generate_trading_signals
+    counts = df.attrs.get('signal_counts')
+    if counts is None:
+        counts = df['Signal'].value_counts().to_dict()
+
+    metrics['Total Signals'] = counts.get('BUY', 0) + counts.get('SELL', 0)
+    metrics['Buy Signals'] = counts.get('BUY', 0)
+    metrics['Sell Signals'] = counts.get('SELL', 0)
+    metrics['Hold Periods'] = counts.get('HOLD', 0)
     
     # Signal strength breakdown
     signal_df = df[df['Signal'] != 'HOLD']
@@ -394,18 +422,26 @@ def create_indicator_correlation_chart(df: pd.DataFrame) -> go.Figure:
     """
     # Select numeric columns for correlation
     numeric_cols = ['Close', 'MFI', 'MACD', 'MACD_Signal', 'MACD_Histogram']
-    
-    # Calculate correlation matrix
-    corr_matrix = df[numeric_cols].corr()
-    
+
+    # One corrcoef call over a contiguous float32 block instead of
+    # pandas' column-pairwise path; the only NaNs are the MFI warm-up
+    # rows, so dropping incomplete rows loses nothing of interest
+    arr = df[numeric_cols].to_numpy(dtype=np.float32)
+    arr = arr[~np.isnan(arr).any(axis=1)]
+
+    if arr.shape[0] >= 2:
+        corr_matrix = np.corrcoef(arr, rowvar=False)
+    else:
+        corr_matrix = np.full((len(numeric_cols), len(numeric_cols)), np.nan)
+
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
-        z=corr_matrix.values,
-        x=corr_matrix.columns,
-        y=corr_matrix.columns,
+        z=corr_matrix,
+        x=numeric_cols,
+        y=numeric_cols,
         colorscale='RdBu',
         zmid=0,
-        text=corr_matrix.values.round(3),
+        text=corr_matrix.round(3),
         texttemplate="%{text}",
         textfont={"size": 10},
         hoverongaps=False